@@ -26,7 +26,6 @@ bl_info = {
 import bpy
 import os
 import sys
-from importlib import reload
 from bpy.app.handlers import persistent
 
 # Add module path if running as script
@@ -35,15 +34,55 @@ if __name__ == "__main__":
     if script_dir not in sys.path:
         sys.path.append(script_dir)
 
-# Create a global reference to bl_info
-_bl_info = bl_info.copy()
+# Classes registered by this module, recorded one by one as they register
+# so unregister can undo a partial registration
+_registered = set()
 
-# Import all modules (after creating _bl_info)
-from . import constants
-from . import geometry
-from . import utils
-from . import core
-from . import ui
+# Owner token for message bus subscriptions, used to clear them on unregister
+_msgbus_owner = object()
+
+
+def _cleanup_visualization(reason, redraw=True):
+    """
+    Disable the viewport visualization and drop its data.
+
+    Shared by the persistent handlers below so the cleanup sequence
+    lives in one place.
+
+    Args:
+        reason: Short description of the trigger, used in error messages
+        redraw: Whether to tag all 3D viewports for redraw afterwards
+    """
+    if not bpy.context:
+        return
+
+    try:
+        # Import here to avoid circular imports
+        from .ui.visualization import (
+            disable_visualization,
+            clear_visualization_data,
+            is_visualization_active,
+        )
+        # Nothing was drawn, so the viewports don't need a redraw
+        was_active = is_visualization_active()
+        # First disable the visualization
+        disable_visualization(bpy.context)
+        # Then clear all visualization data
+        clear_visualization_data()
+
+        if redraw and was_active:
+            # Force a redraw of all 3D viewports
+            wm = bpy.context.window_manager
+            areas = [
+                area
+                for window in wm.windows
+                for area in window.screen.areas
+                if area.type == "VIEW_3D"
+            ]
+            for area in areas:
+                area.tag_redraw()
+    except Exception as e:
+        print(f"Error during visualization cleanup on {reason}: {e}")
 
 
 # Scene handler functions moved directly to this file to avoid circular imports
@@ -58,23 +97,11 @@ def on_file_load(dummy):
     clear_all_caches()
     
     # Disable any active visualization
-    if bpy.context:
-        try:
-            # Import here to avoid circular imports
-            from .ui.visualization import disable_visualization, clear_visualization_data
-            # First disable the visualization
-            disable_visualization(bpy.context)
-            # Then clear all visualization data
-            clear_visualization_data()
-            
-            # Force a redraw of all 3D viewports
-            for window in bpy.context.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
-        except Exception as e:
-            print(f"Error during visualization cleanup on file load: {e}")
-    
+    _cleanup_visualization("file load")
+
+    # Loading a file drops all message bus subscriptions, so renew ours
+    subscribe_scene_switch()
+
     # Reset the visualization enabled property if it exists
     try:
         for scene in bpy.data.scenes:
@@ -84,30 +111,14 @@ def on_file_load(dummy):
         print(f"Error resetting visualization property: {e}")
 
 
-@persistent
-def on_scene_change(dummy):
+def on_scene_change(*args):
     """
-    Handler called when switching between scenes.
+    Message bus callback fired when a window switches to another scene.
     This ensures visualizations match the current scene.
     """
     # Disable any active visualization in old scene
-    if bpy.context:
-        try:
-            # Import here to avoid circular imports
-            from .ui.visualization import disable_visualization, clear_visualization_data
-            # First disable the visualization
-            disable_visualization(bpy.context)
-            # Then clear all visualization data
-            clear_visualization_data()
-            
-            # Force a redraw of all 3D viewports
-            for window in bpy.context.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type == 'VIEW_3D':
-                        area.tag_redraw()
-        except Exception as e:
-            print(f"Error during visualization cleanup on scene change: {e}")
-    
+    _cleanup_visualization("scene change")
+
     # Make sure the UI reflects the correct state
     try:
         if hasattr(bpy.context, "scene") and bpy.context.scene and hasattr(bpy.context.scene, "scaleform_vis_enabled"):
@@ -128,13 +139,37 @@ def on_load_pre(dummy):
     clear_all_caches()
     
     # Try to disable visualization before loading new file
-    if bpy.context:
-        try:
-            from .ui.visualization import disable_visualization, clear_visualization_data
-            disable_visualization(bpy.context)
-            clear_visualization_data()
-        except Exception as e:
-            print(f"Error during pre-load visualization cleanup: {e}")
+    _cleanup_visualization("pre-load", redraw=False)
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    """
+    Handler called after the dependency graph is updated.
+    Drops cached curve selections when a curve's geometry or transform changes,
+    since the selection cache key doesn't include the curve points.
+    """
+    for update in depsgraph.updates:
+        if not (update.is_updated_geometry or update.is_updated_transform):
+            continue
+        data = update.id
+        if isinstance(data, bpy.types.Curve) or (
+            isinstance(data, bpy.types.Object) and data.type == "CURVE"
+        ):
+            from .utils.cache import curve_cache
+            curve_cache.clear(collect=False)
+            return
+
+
+def subscribe_scene_switch():
+    """Subscribe to window scene changes through the message bus."""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Window, "scene"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=on_scene_change,
+    )
 
 
 def register_scene_handlers():
@@ -145,15 +180,12 @@ def register_scene_handlers():
         
     if on_file_load not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(on_file_load)
+
+    if on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
         
-    # For Blender 4.x, use the appropriate handler
-    # Blender 4.0+ uses depsgraph_update_post instead of scene_update_post
-    if hasattr(bpy.app.handlers, "depsgraph_update_post"):
-        if on_scene_change not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(on_scene_change)
-    elif hasattr(bpy.app.handlers, "scene_update_post"):
-        if on_scene_change not in bpy.app.handlers.scene_update_post:
-            bpy.app.handlers.scene_update_post.append(on_scene_change)
+    # Only react to actual scene switches rather than every depsgraph update
+    subscribe_scene_switch()
 
 
 def unregister_scene_handlers():
@@ -164,45 +196,49 @@ def unregister_scene_handlers():
         
     if on_file_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(on_file_load)
+
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
         
-    # Try both handler types for compatibility
-    if hasattr(bpy.app.handlers, "depsgraph_update_post"):
-        if on_scene_change in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.remove(on_scene_change)
-    
-    if hasattr(bpy.app.handlers, "scene_update_post"):
-        if on_scene_change in bpy.app.handlers.scene_update_post:
-            bpy.app.handlers.scene_update_post.remove(on_scene_change)
+    # Drop the scene switch subscription
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
 
+def register_classes(classes):
+    """
+    Register classes in order, recording each one as soon as it succeeds.
 
-def reload_modules():
-    """Reload all modules for development."""
-    # Reload in dependency order
-    reload(constants)
+    Recording per class means a failure partway through still leaves the
+    classes that did register known to unregister_classes.
 
-    # Geometry package
-    reload(geometry.base)
-    reload(geometry.matrix)
-    reload(geometry.utils)
-    reload(geometry)
+    Args:
+        classes: Classes to register, in dependency order
+    """
+    for cls in classes:
+        if cls in _registered:
+            continue
+        try:
+            bpy.utils.register_class(cls)
+            _registered.add(cls)
+        except Exception as e:
+            print(f"Error registering {cls.__name__}: {e}")
 
-    # Utils package
-    reload(utils.cache)
-    reload(utils.helpers)
-    reload(utils)
 
-    # Core package
-    reload(core.calculator)
-    reload(core.processor)
-    reload(core.exporter)
-    reload(core)
+def unregister_classes(classes):
+    """
+    Unregister the recorded classes in reverse order.
 
-    # UI package last
-    reload(ui.properties)
-    reload(ui.visualization)
-    reload(ui.operators)
-    reload(ui.panels)
-    reload(ui)
+    Args:
+        classes: Classes passed to register_classes, in registration order
+    """
+    for cls in reversed(classes):
+        if cls not in _registered:
+            continue
+        try:
+            bpy.utils.unregister_class(cls)
+        except Exception as e:
+            print(f"Error unregistering {cls.__name__}: {e}")
+        _registered.discard(cls)
 
 
 def register():
@@ -210,12 +246,16 @@ def register():
     # Force unregister first to prevent double registration
     force_unregister()
 
-    # Reload modules in development mode
-    if hasattr(bpy.app, "debug") and bpy.app.debug:
-        reload_modules()
+    # Reload modules in development mode (opt in with SCALEFORM_DEV_RELOAD=1)
+    if os.environ.get("SCALEFORM_DEV_RELOAD") == "1":
+        from ._dev import reload_modules
+        reload_modules(__name__)
 
-    # Step 1: Register property group class
-    bpy.utils.register_class(ui.ScaleformCalculatorSettings)
+    # Import the UI package only once Blender actually needs its classes
+    from . import ui
+
+    # Step 1: Register all classes (property group first)
+    register_classes(ui.classes)
 
     # Step 2: Register pointer property for scene
     bpy.types.Scene.scaleform_settings = bpy.props.PointerProperty(
@@ -225,33 +265,23 @@ def register():
     # Step 3: Register additional scene properties
     ui.register()
 
-    # Step 4: Register UI classes in correct order
-    for cls in ui.classes:
-        if cls.__name__ != "ScaleformCalculatorSettings" and not hasattr(
-            bpy.types, cls.__name__
-        ):
-            try:
-                bpy.utils.register_class(cls)
-            except Exception as e:
-                print(f"Error registering {cls.__name__}: {e}")
-
-    # Step 5: Register scene handlers for visualization cleanup
+    # Step 4: Register scene handlers for visualization cleanup
     register_scene_handlers()
     
-    # Step 6: Ensure no visualization is active initially
+    # Step 5: Ensure no visualization is active initially
     try:
         from .ui.visualization import clear_visualization_data
         clear_visualization_data()
     except Exception as e:
         print(f"Error clearing visualization data during registration: {e}")
 
-    print(
-        f"Registered {_bl_info['name']} v{'.'.join(str(v) for v in _bl_info['version'])}"
-    )
+    print(f"Registered {bl_info['name']} v{'.'.join(map(str, bl_info['version']))}")
 
 
 def unregister():
     """Unregister the add-on from Blender."""
+    from . import ui, utils
+
     # First disable any active visualizations
     try:
         from .ui.visualization import disable_visualization, clear_visualization_data
@@ -267,30 +297,17 @@ def unregister():
     # Clear all caches
     utils.clear_all_caches()
 
-    # Step 1: Unregister UI classes in reverse order
-    for cls in reversed(ui.classes):
-        try:
-            if cls.__name__ != "ScaleformCalculatorSettings" and hasattr(
-                bpy.types, cls.__name__
-            ):
-                bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"Error unregistering {cls.__name__}: {e}")
-
-    # Step 2: Unregister additional scene properties
+    # Step 1: Unregister additional scene properties
     ui.unregister()
 
-    # Step 3: Unregister the pointer property
+    # Step 2: Unregister the pointer property
     if hasattr(bpy.types.Scene, "scaleform_settings"):
         del bpy.types.Scene.scaleform_settings
 
-    # Step 4: Unregister the property group class
-    try:
-        bpy.utils.unregister_class(ui.ScaleformCalculatorSettings)
-    except Exception as e:
-        print(f"Error unregistering ScaleformCalculatorSettings: {e}")
+    # Step 3: Unregister all classes in reverse order
+    unregister_classes(ui.classes)
 
-    print(f"Unregistered {_bl_info['name']}")
+    print(f"Unregistered {bl_info['name']}")
 
 
 def force_unregister():
@@ -319,12 +336,18 @@ def force_unregister():
             del bpy.types.Scene.scaleform_settings
 
         # Unregister UI classes in reverse order
+        unregister_classes(ui.classes)
+
+        # A previous instance of this module (e.g. before a script reload)
+        # may have registered its own copies of the classes, which this
+        # instance never recorded; find those by name on bpy.types
         for cls in reversed(ui.classes):
-            try:
-                if hasattr(bpy.types, cls.__name__):
-                    bpy.utils.unregister_class(cls)
-            except:
-                pass
+            stale = getattr(bpy.types, cls.__name__, None)
+            if stale is not None:
+                try:
+                    bpy.utils.unregister_class(stale)
+                except Exception:
+                    pass
 
     except Exception as e:
         print(f"Error during force unregister: {e}")
@@ -0,0 +1,35 @@
+"""
+Development helpers for GTA V Scaleform Minimap Calculator.
+
+This module is only imported when the SCALEFORM_DEV_RELOAD environment
+variable is set to "1", so shipped installs never load it.
+"""
+
+import sys
+from importlib import reload
+
+# Top-level modules in the order they must be reloaded
+_RELOAD_ORDER = ("constants", "geometry", "utils", "core", "ui")
+
+
+def reload_modules(package: str) -> None:
+    """
+    Reload all loaded submodules of the add-on package.
+
+    Args:
+        package: Name of the add-on package (its ``__name__``)
+    """
+    prefix = package + "."
+
+    def reload_order(name):
+        # Packages in dependency order, with submodules before their package
+        parts = name[len(prefix):].split(".")
+        if parts[0] in _RELOAD_ORDER:
+            rank = _RELOAD_ORDER.index(parts[0])
+        else:
+            rank = len(_RELOAD_ORDER)
+        return (rank, -len(parts))
+
+    names = sorted((n for n in sys.modules if n.startswith(prefix)), key=reload_order)
+    for name in names:
+        reload(sys.modules[name])
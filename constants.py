@@ -5,10 +5,13 @@ This module defines configuration constants used throughout the addon
 for calculations, visualizations, and default values.
 """
 
+import math
+from enum import IntEnum
+
 import numpy as np
 
 # Mathematical constants
-MATH_PI = np.float64(3.14159265358979323846)
+MATH_PI = math.pi
 
 # World boundaries for GTA V map (min_x, max_x, min_y, max_y)
 WORLD_BOUNDS = (-4000.0, 4000.0, -4000.0, 4000.0)
@@ -20,15 +23,32 @@ MINIMAP_SIZE = (300.0, 300.0)
 SVG_SCALE_FACTOR = 1.0
 
 # Visualization colors (RGBA format, values from 0.0 to 1.0)
-BOUNDS_COLOR = (0.2, 0.4, 0.8, 0.8)  # Blue for calculated bounds
-REAL_BOUNDS_COLOR = (0.8, 0.2, 0.2, 0.8)  # Red for actual bounds
-DIRECTION_COLOR = (0.2, 0.8, 0.2, 0.8)  # Green for direction indicator
-CENTER_COLOR = (0.8, 0.8, 0.2, 0.8)  # Yellow for center point
-GRID_COLOR = (0.5, 0.5, 0.5, 0.3)  # Gray for grid
-AXIS_X_COLOR = (0.9, 0.2, 0.2, 0.8)  # Red for X axis
-AXIS_Y_COLOR = (0.2, 0.9, 0.2, 0.8)  # Green for Y axis
-AXIS_Z_COLOR = (0.2, 0.2, 0.9, 0.8)  # Blue for Z axis
-EXPORT_DIRECTION_COLOR = (1.0, 0.5, 0.0, 0.8)  # Orange for export direction
+# Stored as float32 arrays so draw calls can pass them to shaders as-is
+_F32 = np.float32
+BOUNDS_COLOR = np.array((0.2, 0.4, 0.8, 0.8), dtype=_F32)  # Blue for calculated bounds
+REAL_BOUNDS_COLOR = np.array((0.8, 0.2, 0.2, 0.8), dtype=_F32)  # Red for actual bounds
+DIRECTION_COLOR = np.array((0.2, 0.8, 0.2, 0.8), dtype=_F32)  # Green for direction indicator
+CENTER_COLOR = np.array((0.8, 0.8, 0.2, 0.8), dtype=_F32)  # Yellow for center point
+GRID_COLOR = np.array((0.5, 0.5, 0.5, 0.3), dtype=_F32)  # Gray for grid
+AXIS_X_COLOR = np.array((0.9, 0.2, 0.2, 0.8), dtype=_F32)  # Red for X axis
+AXIS_Y_COLOR = np.array((0.2, 0.9, 0.2, 0.8), dtype=_F32)  # Green for Y axis
+AXIS_Z_COLOR = np.array((0.2, 0.2, 0.9, 0.8), dtype=_F32)  # Blue for Z axis
+EXPORT_DIRECTION_COLOR = np.array((1.0, 0.5, 0.0, 0.8), dtype=_F32)  # Orange for export direction
+
+# Make the shared color buffers read-only
+for _color in (
+    BOUNDS_COLOR,
+    REAL_BOUNDS_COLOR,
+    DIRECTION_COLOR,
+    CENTER_COLOR,
+    GRID_COLOR,
+    AXIS_X_COLOR,
+    AXIS_Y_COLOR,
+    AXIS_Z_COLOR,
+    EXPORT_DIRECTION_COLOR,
+):
+    _color.flags.writeable = False
+del _color
 
 # Line width for visualizations
 LINE_WIDTH = 2.0
@@ -45,6 +65,16 @@ FILL_PRESETS = {
     "LIMITS": (0.25, 0.25, 0.25, 1.0),  # Dark grey for area limits
 }
 
+# Path segment types, stored as uint8 codes in spline "types" arrays
+class SegmentType(IntEnum):
+    MOVE = 0
+    LINE = 1
+    CURVE = 2
+
+
+# Number of (x, y) points each segment type stores, indexed by SegmentType
+SEGMENT_POINT_COUNTS = (1, 1, 3)
+
 # Cache configuration
 DEFAULT_CACHE_LIFETIME = 300  # 5 minutes in seconds
 MAX_CACHE_SIZE = 100  # Maximum number of elements in default caches
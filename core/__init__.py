@@ -3,14 +3,36 @@ Core package for GTA V Scaleform Minimap Calculator.
 
 This package provides the main functionality for processing curves
 and converting between coordinate systems.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package alone doesn't load NumPy or the Blender curve helpers.
 """
 
-from .calculator import MinimapCalculator
-from .processor import CurveProcessor
-from .exporter import SVGExporter
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'MinimapCalculator': '.calculator',
+    'CurveProcessor': '.processor',
+    'SVGExporter': '.exporter',
+}
 
 __all__ = [
     'MinimapCalculator',
     'CurveProcessor',
     'SVGExporter'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Lazily import and cache the public classes of this package."""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily loaded names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,96 @@
+"""
+Numeric kernels for GTA V Scaleform Minimap Calculator.
+
+These functions hold the per-point math used by MinimapCalculator. When
+Numba is installed they are compiled to native code; otherwise they run as
+plain Python with identical results.
+"""
+
+from typing import Tuple
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def world_to_minimap_xy(
+    x: float,
+    y: float,
+    scale_x: float,
+    scale_y: float,
+    offset_x: float,
+    offset_y: float,
+    minimap_width: float,
+    minimap_height: float,
+) -> Tuple[float, float]:
+    """
+    Convert a world position to clamped minimap coordinates.
+
+    The world origin and the Y flip are folded into the offsets, so each axis
+    is a single multiply and subtract.
+
+    Returns:
+        Tuple of (x, y) on the minimap, with Y flipped (top-left origin)
+    """
+    minimap_x = x * scale_x - offset_x
+    minimap_y = offset_y - y * scale_y
+    return (
+        max(0.0, min(minimap_x, minimap_width)),
+        max(0.0, min(minimap_y, minimap_height)),
+    )
+
+
+@njit(cache=True, fastmath=True)
+def blender_to_scaleform_xy(
+    y: float, z: float, svg_scale: float, svg_width: float, svg_height: float
+) -> Tuple[float, float]:
+    """
+    Convert Blender Y/Z coordinates to centered Scaleform coordinates.
+
+    Returns:
+        Tuple of (x, y) in Scaleform space
+    """
+    # Blender Y -> Scaleform X, Blender -Z -> Scaleform Y, then center
+    return (
+        y * svg_scale - svg_width * svg_scale / 2,
+        -z * svg_scale - svg_height * svg_scale / 2,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def minimap_to_world_xy(
+    x: float,
+    y: float,
+    minimap_width: float,
+    minimap_height: float,
+    world_min_x: float,
+    world_min_y: float,
+    world_width: float,
+    world_height: float,
+) -> Tuple[float, float]:
+    """
+    Convert minimap coordinates back to world X/Y.
+
+    Returns:
+        Tuple of (x, y) in world space
+    """
+    norm_x = x / minimap_width
+    # Invert Y axis (minimap has origin at top-left)
+    norm_y = 1.0 - y / minimap_height
+    return (
+        world_min_x + norm_x * world_width,
+        world_min_y + norm_y * world_height,
+    )
+
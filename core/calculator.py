@@ -10,6 +10,19 @@ import numpy as np
 
 from ..geometry import Vector2, Vector3
 from ..utils.cache import calculation_cache
+from ._transforms_jit import (
+    NUMBA_AVAILABLE,
+    world_to_minimap_xy,
+    blender_to_scaleform_xy,
+    minimap_to_world_xy,
+)
+
+# Tags that distinguish each conversion's entries in calculation_cache
+_TAG_MINIMAP = 0
+_TAG_SCALEFORM_DATA = 1
+
+# Decimal places kept for minimap coordinates (matches the SVG marker output)
+_MINIMAP_DECIMALS = 2
 
 
 class MinimapCalculator:
@@ -22,6 +35,27 @@ class MinimapCalculator:
     - Scaleform: 2D coordinate system used for GTA V minimap
     """
 
+    __slots__ = [
+        "_cache_key",
+        "world_min_x",
+        "world_max_x",
+        "world_min_y",
+        "world_max_y",
+        "minimap_width",
+        "minimap_height",
+        "world_width",
+        "world_height",
+        "inv_world_width",
+        "inv_world_height",
+        "scale_x",
+        "scale_y",
+        "offset_x",
+        "offset_y",
+        "_offset",
+        "_scale",
+        "_minimap_size",
+    ]
+
     def __init__(
         self,
         world_bounds: Tuple[float, float, float, float],
@@ -34,8 +68,9 @@ class MinimapCalculator:
             world_bounds: Tuple of (min_x, max_x, min_y, max_y) for world boundaries
             minimap_size: Tuple of (width, height) for minimap dimensions
         """
-        # Create cache key for efficient reuse
-        self._cache_key = f"calc_{world_bounds}_{minimap_size}"
+        # Create cache key for efficient reuse (tuples hash much faster than
+        # formatted strings)
+        self._cache_key = (tuple(world_bounds), tuple(minimap_size))
 
         # Store world boundaries
         self.world_min_x, self.world_max_x, self.world_min_y, self.world_max_y = (
@@ -53,6 +88,24 @@ class MinimapCalculator:
         self.inv_world_width = 1.0 / self.world_width if self.world_width != 0 else 0
         self.inv_world_height = 1.0 / self.world_height if self.world_height != 0 else 0
 
+        # Precalculate world to minimap scale factors
+        self.scale_x = self.minimap_width * self.inv_world_width
+        self.scale_y = self.minimap_height * self.inv_world_height
+
+        # Fold the world origin and the Y flip into per-axis offsets:
+        # minimap_x = x * scale_x - offset_x, minimap_y = offset_y - y * scale_y
+        self.offset_x = self.world_min_x * self.scale_x
+        self.offset_y = self.minimap_height + self.world_min_y * self.scale_y
+
+        # Array forms of the above for batch conversions (Y scale negated so
+        # both axes are one multiply-add). Single precision is plenty for
+        # minimap pixels and halves the memory traffic.
+        self._scale = np.array([self.scale_x, -self.scale_y], dtype=np.float32)
+        self._offset = np.array([-self.offset_x, self.offset_y], dtype=np.float32)
+        self._minimap_size = np.array(
+            [self.minimap_width, self.minimap_height], dtype=np.float32
+        )
+
     def world_to_minimap(self, position: Vector3) -> Vector2:
         """
         Convert world coordinates to minimap coordinates.
@@ -66,33 +119,85 @@ class MinimapCalculator:
         Returns:
             Corresponding position on the minimap
         """
+        # A compiled kernel is cheaper than a cache lookup
+        if NUMBA_AVAILABLE:
+            return Vector2(*self._world_to_minimap_xy(position))
+
         # Create cache key for this specific calculation
-        pos_cache_key = f"{self._cache_key}_{position.x:.3f}_{position.y:.3f}_{position.z:.3f}_minimap"
+        pos_cache_key = (
+            self._cache_key,
+            round(position.x, 3),
+            round(position.y, 3),
+            round(position.z, 3),
+            _TAG_MINIMAP,
+        )
 
         # Check if result is in cache
         cached_result = calculation_cache.get(pos_cache_key)
         if cached_result is not None:
             return cached_result
 
-        # Normalize position within world bounds (0.0 to 1.0)
-        norm_x = (position.x - self.world_min_x) * self.inv_world_width
-        norm_y = (position.y - self.world_min_y) * self.inv_world_height
-
-        # Convert normalized position to minimap coordinates
-        # Note: Y-axis is flipped in the minimap (top-left origin)
-        minimap_x = norm_x * self.minimap_width
-        minimap_y = (1.0 - norm_y) * self.minimap_height
-
-        # Clamp to minimap boundaries
-        result = Vector2(
-            max(0.0, min(minimap_x, self.minimap_width)),
-            max(0.0, min(minimap_y, self.minimap_height)),
-        )
+        result = Vector2(*self._world_to_minimap_xy(position))
 
         # Store in cache for future calls
         calculation_cache.set(pos_cache_key, result)
         return result
 
+    def _world_to_minimap_xy(self, position: Vector3) -> Tuple[float, float]:
+        """Run the world to minimap kernel with this calculator's parameters."""
+        return world_to_minimap_xy(
+            position.x,
+            position.y,
+            self.scale_x,
+            self.scale_y,
+            self.offset_x,
+            self.offset_y,
+            self.minimap_width,
+            self.minimap_height,
+        )
+
+    def world_to_minimap_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of world coordinates to minimap coordinates.
+
+        Vectorized equivalent of world_to_minimap for many positions at once.
+
+        Args:
+            positions: Array of shape (N, 2) or (N, 3) with world-space positions
+
+        Returns:
+            Array of shape (N, 2) with the clamped minimap coordinates (float32)
+        """
+        minimap = self.world_to_minimap_batch_unchecked(positions)
+
+        # Positions normally lie inside the world bounds, so check with two
+        # reductions and only pay for the clamp pass when something is outside
+        if minimap.size and (
+            minimap.min() < 0.0 or (minimap.max(axis=0) > self._minimap_size).any()
+        ):
+            np.clip(minimap, 0.0, self._minimap_size, out=minimap)
+        return minimap
+
+    def world_to_minimap_batch_unchecked(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of world coordinates to minimap coordinates without clamping.
+
+        Only use this when every position is known to lie inside the world
+        bounds; points outside them map outside the minimap.
+
+        Args:
+            positions: Array of shape (N, 2) or (N, 3) with world-space positions
+
+        Returns:
+            Array of shape (N, 2) with the minimap coordinates (float32)
+        """
+        # Scale and offset in place; the negated Y scale flips the Y-axis
+        # (the minimap has its origin at the top-left)
+        minimap = positions[:, :2].astype(np.float32)
+        minimap *= self._scale
+        minimap += self._offset
+        return minimap
+
     def blender_to_scaleform(
         self, position: Vector3, svg_scale: float, svg_width: float, svg_height: float
     ) -> Vector2:
@@ -111,27 +216,14 @@ class MinimapCalculator:
         Returns:
             Corresponding position in Scaleform coordinates
         """
-        # Create cache key for this specific calculation
-        cache_key = f"{position.x:.3f}_{position.y:.3f}_{position.z:.3f}_{svg_scale}_{svg_width}_{svg_height}"
-
-        # Check if result is in cache
-        cached_result = calculation_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-
         # Convert coordinate systems (Blender Y -> Scaleform X, Blender -Z -> Scaleform Y)
-        scaleform_x = position.y * svg_scale
-        scaleform_y = -position.z * svg_scale
-
-        # Center the coordinates based on SVG dimensions
-        centered_x = scaleform_x - (svg_width * svg_scale / 2)
-        centered_y = scaleform_y - (svg_height * svg_scale / 2)
-
-        result = Vector2(centered_x, centered_y)
-
-        # Store in cache for future calls
-        calculation_cache.set(cache_key, result)
-        return result
+        # and center the coordinates based on SVG dimensions. Not cached: the
+        # arithmetic is cheaper than building and looking up a cache key.
+        return Vector2(
+            *blender_to_scaleform_xy(
+                position.y, position.z, svg_scale, svg_width, svg_height
+            )
+        )
 
     def generate_scaleform_data(self, positions: List[Vector3]) -> Dict[str, Any]:
         """
@@ -143,35 +235,78 @@ class MinimapCalculator:
             positions: List of world-space positions to convert
 
         Returns:
-            Dictionary containing minimap points with their world coordinates
+            Dictionary of parallel lists (minimap_x, minimap_y, world_x,
+            world_y, world_z), one entry per position
+        """
+        # Pack the positions into one (N, 3) array without intermediate tuples
+        return self.generate_scaleform_data_array(Vector3.stack(positions))
+
+    def generate_scaleform_data_array(self, positions: np.ndarray) -> Dict[str, Any]:
         """
-        # Create a hash of the positions for the cache key
-        pos_hash = hash(tuple((p.x, p.y, p.z) for p in positions))
-        cache_key = f"{self._cache_key}_{pos_hash}_scaleform_data"
+        Generate Scaleform position data for an array of world positions.
+
+        Array form of generate_scaleform_data for callers that already keep
+        their positions in an (N, 3) array.
+
+        Args:
+            positions: Array of shape (N, 3) with world-space positions
+
+        Returns:
+            Dictionary of parallel lists (minimap_x, minimap_y, world_x,
+            world_y, world_z), one entry per position
+        """
+        world = np.ascontiguousarray(positions, dtype=np.float64)
+
+        # Key on the raw bytes of the array (hashed in C, no per-float tuples)
+        cache_key = (self._cache_key, world.tobytes(), _TAG_SCALEFORM_DATA)
 
         # Check if result is in cache
         cached_result = calculation_cache.get(cache_key)
         if cached_result is not None:
             return cached_result
 
-        # Generate minimap coordinates for each position
+        # Convert all positions in one batch and round to the output precision
+        # up front, so the float32 results come out as clean Python floats
+        minimap = self.world_to_minimap_batch(world).astype(np.float64)
+        minimap.round(_MINIMAP_DECIMALS, out=minimap)
+
+        # Store each column as one flat list instead of a dict per point
+        minimap_x, minimap_y = minimap.T.tolist()
+        world_x, world_y, world_z = world.T.tolist()
         result = {
-            "minimap_points": [
-                {
-                    "x": (minimap_pos := self.world_to_minimap(pos)).x,
-                    "y": minimap_pos.y,
-                    "world_x": pos.x,
-                    "world_y": pos.y,
-                    "world_z": pos.z,
-                }
-                for pos in positions
-            ]
+            "minimap_x": minimap_x,
+            "minimap_y": minimap_y,
+            "world_x": world_x,
+            "world_y": world_y,
+            "world_z": world_z,
         }
 
         # Store in cache for future calls
         calculation_cache.set(cache_key, result)
         return result
 
+    @staticmethod
+    def as_records(scaleform_data: Dict[str, List[float]]) -> List[Dict[str, float]]:
+        """
+        Convert generate_scaleform_data output to one dictionary per point.
+
+        Args:
+            scaleform_data: Column dictionary from generate_scaleform_data
+
+        Returns:
+            List of dictionaries with x, y, world_x, world_y and world_z keys
+        """
+        return [
+            {"x": x, "y": y, "world_x": wx, "world_y": wy, "world_z": wz}
+            for x, y, wx, wy, wz in zip(
+                scaleform_data["minimap_x"],
+                scaleform_data["minimap_y"],
+                scaleform_data["world_x"],
+                scaleform_data["world_y"],
+                scaleform_data["world_z"],
+            )
+        ]
+
     def minimap_to_world(self, minimap_pos: Vector2) -> Vector3:
         """
         Convert minimap coordinates back to approximate world coordinates.
@@ -185,26 +320,19 @@ class MinimapCalculator:
         Returns:
             Corresponding world-space position (with Z=0)
         """
-        # Create cache key for this specific calculation
-        cache_key = f"{self._cache_key}_{minimap_pos.x:.3f}_{minimap_pos.y:.3f}_world"
-
-        # Check if result is in cache
-        cached_result = calculation_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-
-        # Normalize position within minimap (0.0 to 1.0)
-        norm_x = minimap_pos.x / self.minimap_width
-        # Invert Y axis (minimap has origin at top-left)
-        norm_y = 1.0 - (minimap_pos.y / self.minimap_height)
-
-        # Convert to world coordinates
-        world_x = self.world_min_x + norm_x * self.world_width
-        world_y = self.world_min_y + norm_y * self.world_height
-
-        # Create result (Z is set to 0 as this information is lost in minimap)
-        result = Vector3(world_x, world_y, 0.0)
-
-        # Store in cache for future calls
-        calculation_cache.set(cache_key, result)
-        return result
+        # Z is set to 0 as this information is lost in minimap. Not cached: the
+        # arithmetic is cheaper than building and looking up a cache key.
+        return Vector3(*self._minimap_to_world_xy(minimap_pos), 0.0)
+
+    def _minimap_to_world_xy(self, minimap_pos: Vector2) -> Tuple[float, float]:
+        """Run the minimap to world kernel with this calculator's parameters."""
+        return minimap_to_world_xy(
+            minimap_pos.x,
+            minimap_pos.y,
+            self.minimap_width,
+            self.minimap_height,
+            self.world_min_x,
+            self.world_min_y,
+            self.world_width,
+            self.world_height,
+        )
@@ -7,10 +7,43 @@ to SVG format for use in GTA V minimap creation.
 
 import os
 import json
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Any, Optional
 
 from ..geometry import GPointF, GRectF, Vector2
 from ..geometry.utils import GeometryUtils
+from .calculator import MinimapCalculator
+
+# SVG path templates for each segment type, indexed by SegmentType
+_SEGMENT_TEMPLATES = (
+    "M %s,%s",
+    "L %s,%s",
+    "C %s,%s %s,%s %s,%s",
+)
+
+
+@lru_cache(maxsize=16)
+def _segment_templates(precision: int) -> Tuple[str, ...]:
+    """Return the segment templates with the coordinate precision baked in."""
+    coord = f"%.{precision}f"
+    return tuple(template.replace("%s", coord) for template in _SEGMENT_TEMPLATES)
+
+
+# Translation table for the comma decimal separator
+_DOT_TO_COMMA = str.maketrans(".", ",")
+
+# Document templates, parsed once instead of building f-strings per call
+_HEADER_TMPL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<svg width="%.2fpx" height="%.2fpx" viewBox="0 0 %.2f %.2f" xmlns="http://www.w3.org/2000/svg">
+  <g transform="scale(%s)">
+"""
+_EMPTY_RECT_TMPL = '    <rect x="0" y="0" width="%.2f" height="%.2f" fill="none" stroke="red" stroke-width="0.5" stroke-dasharray="2,2" />\n'
+_EMPTY_TEXT_TMPL = '    <text x="%.2f" y="%.2f" text-anchor="middle" fill="red">No curve data</text>\n'
+_FOOTER = "  </g>\n</svg>"
+
+# Two-stage template: the style attributes are filled in first, leaving the
+# escaped placeholder for the path data
+_PATH_TMPL = '    <path d="%%s" %s />\n'
 
 
 class SVGExporter:
@@ -21,12 +54,15 @@ class SVGExporter:
     and exporting it to files.
     """
 
+    # Stateless: all methods are static, so instances carry no attributes
+    __slots__ = []
+
     @staticmethod
     def generate_svg_content(
         dimensions: Dict[str, float],
         normalized_curves: List[Dict[str, Any]],
         settings,
-        minimap_coords: List[Dict[str, float]],
+        minimap_coords: Dict[str, List[float]],
     ) -> str:
         """
         Generate SVG content from normalized curve data.
@@ -35,106 +71,175 @@ class SVGExporter:
             dimensions: Dictionary with width and height information
             normalized_curves: List of normalized curve objects with style information
             settings: Blender settings object containing SVG export settings
-            minimap_coords: List of minimap coordinate points
+            minimap_coords: Minimap point columns as returned by
+                MinimapCalculator.generate_scaleform_data
 
         Returns:
             String containing complete SVG document
         """
-        width = max(0.1, dimensions["width_svg"]) * settings.svg_scale
-        height = max(0.1, dimensions["height_svg"]) * settings.svg_scale
+        # Read the scale once; it is used throughout the document
+        scale = settings.svg_scale
+        inv_scale = 1.0 / scale
+
+        width = max(0.1, dimensions["width_svg"]) * scale
+        height = max(0.1, dimensions["height_svg"]) * scale
+
+        # Collect document pieces in a list and join once at the end
+        parts = []
 
         # Start SVG document
-        svg_content = f"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<svg width="{width:.2f}px" height="{height:.2f}px" viewBox="0 0 {width:.2f} {height:.2f}" xmlns="http://www.w3.org/2000/svg">
-  <g transform="scale({settings.svg_scale})">
-"""
+        parts.append(_HEADER_TMPL % (width, height, width, height, scale))
+
         # Check for empty curves
         if not normalized_curves or len(normalized_curves) == 0:
-            svg_content += f'    <rect x="0" y="0" width="{width/settings.svg_scale:.2f}" height="{height/settings.svg_scale:.2f}" fill="none" stroke="red" stroke-width="0.5" stroke-dasharray="2,2" />\n'
-            svg_content += f'    <text x="{width/(2*settings.svg_scale):.2f}" y="{height/(2*settings.svg_scale):.2f}" text-anchor="middle" fill="red">No curve data</text>\n'
+            inner_width = width * inv_scale
+            inner_height = height * inv_scale
+            parts.append(_EMPTY_RECT_TMPL % (inner_width, inner_height))
+            parts.append(_EMPTY_TEXT_TMPL % (inner_width * 0.5, inner_height * 0.5))
         else:
+            # Read path formatting settings once (Blender property access is slow)
+            precision = settings.precision
+            use_comma = settings.use_comma_separator
+
             # Process each curve with its own style information
             for curve_obj in normalized_curves:
                 splines = curve_obj["splines"]
                 style = curve_obj["style"]
 
-                # If style information exists, use it
-                if style:
-                    fill_color = (
-                        GeometryUtils.hex_from_rgba(style["fill_color"])
-                        if style["use_fill"]
-                        else "none"
-                    )
-                    stroke_color = (
-                        GeometryUtils.hex_from_rgba(style["stroke_color"])
-                        if style["use_stroke"]
-                        else "none"
-                    )
-                    stroke_width = style["stroke_width"] if style["use_stroke"] else 0
-                else:
-                    # Fallback to global settings
-                    fill_color = (
-                        GeometryUtils.hex_from_rgba(settings.fill_color)
-                        if settings.use_fill
-                        else "none"
-                    )
-                    stroke_color = (
-                        GeometryUtils.hex_from_rgba(settings.stroke_color)
-                        if settings.use_stroke
-                        else "none"
-                    )
-                    stroke_width = settings.stroke_width if settings.use_stroke else 0
-
-                # Generate path data for all splines in the object
-                for spline in splines:
-                    path_data = SVGExporter._generate_path_data(
-                        spline, settings.precision, settings.use_comma_separator
-                    )
-                    if path_data:
-                        svg_content += f'    <path d="{path_data}" fill="{fill_color}" stroke="{stroke_color}" stroke-width="{stroke_width}" />\n'
+                # Resolve the style attributes once for all splines of this object
+                style_attrs = SVGExporter._resolve_style_attrs(style, settings)
+
+                # Generate path elements for all splines in the object with an
+                # emitter specialized for these settings
+                emit = SVGExporter._compile_emitter(precision, use_comma, style_attrs)
+                parts.append(emit(splines))
 
         # Close SVG document
-        return svg_content + "  </g>\n</svg>"
+        parts.append(_FOOTER)
+        return "".join(parts)
 
     @staticmethod
-    def _generate_path_data(
-        spline: List[Dict[str, Any]], precision: int, use_comma: bool
-    ) -> str:
+    def _resolve_style_attrs(style: Optional[Dict[str, Any]], settings) -> str:
+        """
+        Build the fill and stroke attribute string for a curve object.
+
+        Args:
+            style: Per-object style information, or None to use global settings
+            settings: Blender settings object providing the fallback style
+
+        Returns:
+            String with fill, stroke and stroke-width SVG attributes
+        """
+        # If style information exists, use it
+        if style:
+            fill_color = (
+                GeometryUtils.hex_from_rgba(style["fill_color"])
+                if style["use_fill"]
+                else "none"
+            )
+            stroke_color = (
+                GeometryUtils.hex_from_rgba(style["stroke_color"])
+                if style["use_stroke"]
+                else "none"
+            )
+            stroke_width = style["stroke_width"] if style["use_stroke"] else 0
+        else:
+            # Fallback to global settings
+            fill_color = (
+                GeometryUtils.hex_from_rgba(settings.fill_color)
+                if settings.use_fill
+                else "none"
+            )
+            stroke_color = (
+                GeometryUtils.hex_from_rgba(settings.stroke_color)
+                if settings.use_stroke
+                else "none"
+            )
+            stroke_width = settings.stroke_width if settings.use_stroke else 0
+
+        return f'fill="{fill_color}" stroke="{stroke_color}" stroke-width="{stroke_width}"'
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_emitter(
+        precision: int, use_comma: bool, style_attrs: str
+    ) -> Callable[[List[Dict[str, Any]]], str]:
+        """
+        Build a path emitter for one set of export settings.
+
+        The style attributes are baked into the path element template when
+        the emitter is built, and each spline's path data comes from
+        path_data. Emitters are cached for repeated exports with
+        the same settings.
+
+        Args:
+            precision: Number of decimal places for coordinates
+            use_comma: Whether to use comma as decimal separator
+            style_attrs: Resolved fill/stroke attribute string for the paths
+
+        Returns:
+            Function turning a list of splines into SVG path elements
+        """
+        line = _PATH_TMPL % style_attrs
+        path_data = SVGExporter.path_data
+
+        def emit(splines):
+            lines = []
+            append = lines.append
+            for spline in splines:
+                data = path_data(spline, precision, use_comma)
+                if data:
+                    append(line % data)
+            return "".join(lines)
+
+        return emit
+
+    @staticmethod
+    def _collect_path_segments(
+        spline: Dict[str, Any], templates: Tuple[str, ...]
+    ) -> Tuple[str, List[float]]:
+        """
+        Build the path template and flat coordinate list for a spline.
+
+        Args:
+            spline: Spline dictionary with "types" and "points" arrays
+            templates: Segment templates from _segment_templates
+
+        Returns:
+            Tuple of (%-template for the path, flat list of x/y coordinates)
+        """
+        # The points are already stored in segment order, so the coordinates
+        # come straight from the array
+        template = " ".join(
+            [templates[seg_type] for seg_type in spline["types"].tolist()]
+        )
+        return template, spline["points"].ravel().tolist()
+
+    @staticmethod
+    def path_data(spline: Dict[str, Any], precision: int, use_comma: bool) -> str:
         """
         Generate SVG path data from spline segments.
 
         Args:
-            spline: List of spline segments
+            spline: Spline dictionary with "types" and "points" arrays
             precision: Number of decimal places for coordinates
             use_comma: Whether to use comma as decimal separator
 
         Returns:
             SVG path data string
         """
-        # Join multiple segments into a single path for better performance
-        path_segments = []
-
-        for segment in spline:
-            seg_type, points = segment["type"], segment["points"]
-            if seg_type == "M":
-                x = GeometryUtils.format_coordinate(points[0].x, precision, use_comma)
-                y = GeometryUtils.format_coordinate(points[0].y, precision, use_comma)
-                path_segments.append(f"M {x},{y}")
-            elif seg_type == "L":
-                x = GeometryUtils.format_coordinate(points[0].x, precision, use_comma)
-                y = GeometryUtils.format_coordinate(points[0].y, precision, use_comma)
-                path_segments.append(f"L {x},{y}")
-            elif seg_type == "C":
-                x1 = GeometryUtils.format_coordinate(points[0].x, precision, use_comma)
-                y1 = GeometryUtils.format_coordinate(points[0].y, precision, use_comma)
-                x2 = GeometryUtils.format_coordinate(points[1].x, precision, use_comma)
-                y2 = GeometryUtils.format_coordinate(points[1].y, precision, use_comma)
-                x3 = GeometryUtils.format_coordinate(points[2].x, precision, use_comma)
-                y3 = GeometryUtils.format_coordinate(points[2].y, precision, use_comma)
-                path_segments.append(f"C {x1},{y1} {x2},{y2} {x3},{y3}")
-
-        # Join all segments with a single space
-        return " ".join(path_segments)
+        template, coords = SVGExporter._collect_path_segments(
+            spline, _segment_templates(precision)
+        )
+
+        # The precision is part of the templates, so the whole path is
+        # formatted in a single operation
+        path_data = template % tuple(coords)
+
+        # Swap the decimal separator in one C-level pass over the whole path
+        if use_comma:
+            path_data = path_data.translate(_DOT_TO_COMMA)
+        return path_data
 
     @staticmethod
     def export_svg_file(filepath: str, svg_content: str) -> None:
@@ -145,8 +250,10 @@ class SVGExporter:
             filepath: Path to save the SVG file
             svg_content: SVG content to write
         """
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(svg_content)
+        # Encode once and hand the whole buffer to a single write call
+        data = svg_content.encode("utf-8")
+        with open(filepath, "wb", buffering=0) as f:
+            f.write(data)
 
     @staticmethod
     def export_minimap_data(filepath: str, minimap_data: Dict[str, Any]) -> str:
@@ -155,12 +262,16 @@ class SVGExporter:
 
         Args:
             filepath: Base path for the SVG file
-            minimap_data: Minimap data to export
+            minimap_data: Column data from MinimapCalculator.generate_scaleform_data
 
         Returns:
             Path to the exported JSON file
         """
         json_filepath = os.path.join(os.path.dirname(filepath), "minimap_data.json")
-        with open(json_filepath, "w") as f:
-            json.dump(minimap_data, f, indent=2)
+        # Keep the file's established layout: one record per minimap point
+        records = {"minimap_points": MinimapCalculator.as_records(minimap_data)}
+        # Serialize to one string instead of streaming many small fragments
+        payload = json.dumps(records, indent=2).encode("utf-8")
+        with open(json_filepath, "wb") as f:
+            f.write(payload)
         return json_filepath
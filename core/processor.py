@@ -6,13 +6,18 @@ from Blender objects for use in GTA V minimap creation.
 """
 
 import bpy
+import hashlib
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 
-from ..geometry import GPointF, GRectF, Vector3, calculate_bounds
-from ..constants import OPTIMIZATION_THRESHOLD
+from ..geometry import GPointF, GRectF, Vector3, bounds_from_extents
+from ..constants import OPTIMIZATION_THRESHOLD, SegmentType, SEGMENT_POINT_COUNTS
 from ..utils.cache import curve_cache, geometry_cache
 
+# Last calculate_dimensions result with the bounds and center objects it was
+# derived from. Holding the references keeps the identity check valid.
+_last_dimensions = (None, None, None)
+
 
 class CurveProcessor:
     """
@@ -22,103 +27,123 @@ class CurveProcessor:
     and calculating dimensions for SVG export.
     """
 
+    # Stateless: all methods are static, so instances carry no attributes
+    __slots__ = []
+
     @staticmethod
-    def _process_bezier_spline(spline, matrix, spline_points, all_points):
+    def _process_bezier_splines(splines, matrix, anchors_outs):
         """
-        Process a Bezier spline into path segments.
+        Process all Bezier splines of one object into path segments.
+
+        The points of every spline are read into one buffer and transformed
+        with a single matrix product before being split back per spline.
 
         Args:
-            spline: Blender Bezier spline to process
+            splines: Blender Bezier splines of one object
             matrix: World transformation matrix to apply
-            spline_points: List to store the resulting path segments
-            all_points: List to store all processed points (for bounds calculation)
+            anchors_outs: One (N, 2) array view per spline that receives the
+                transformed anchor points (for bounds calculation)
+
+        Returns:
+            List with, per spline, a dictionary with "types" (uint8
+            SegmentType codes) and "points" ((K, 2) float32 array holding each
+            segment's points in order), or None if the spline has no points
         """
-        # Precompute initial data
-        bezier_points = spline.bezier_points
-        use_cyclic = spline.use_cyclic_u
+        point_lists = [spline.bezier_points for spline in splines]
+        counts = [len(bezier_points) for bezier_points in point_lists]
+        starts = np.cumsum([0] + counts).tolist()
+
+        # Read control points and both handles of every spline straight into
+        # one buffer, laid out as (which, point, xyz). Blender stores
+        # coordinates and matrices in single precision, so the whole transform
+        # stays float32.
+        buffer = np.empty((3, starts[-1] * 3), dtype=np.float32)
+        for bezier_points, start, end in zip(point_lists, starts, starts[1:]):
+            if end > start:
+                co, hl, hr = buffer[:, start * 3 : end * 3]
+                bezier_points.foreach_get("co", co)
+                bezier_points.foreach_get("handle_left", hl)
+                bezier_points.foreach_get("handle_right", hr)
+
+        # Apply the affine part of the world matrix to all points in one
+        # batched product, keeping only the X/Y output rows
+        world = np.asarray(matrix, dtype=np.float32)
+        co_all, hl_all, hr_all = (
+            buffer.reshape(3, starts[-1], 3) @ world[:2, :3].T + world[:2, 3]
+        )
+
+        results = []
+        for spline, anchors_out, start, end in zip(
+            splines, anchors_outs, starts, starts[1:]
+        ):
+            if end == start:
+                results.append(None)
+                continue
+
+            co, hl, hr = co_all[start:end], hl_all[start:end], hr_all[start:end]
+            anchors_out[:] = co
+
+            # Move to the first point, then one curve per following point with
+            # (previous right handle, left handle, point) as its points
+            parts = [
+                co[:1],
+                np.stack((hr[:-1], hl[1:], co[1:]), axis=1).reshape(-1, 2),
+            ]
+            curve_count = end - start - 1
 
-        if not bezier_points:
-            return
+            # Close the curve if cyclic
+            if spline.use_cyclic_u:
+                parts.append(np.stack((hr[-1], hl[0], co[0])))
+                curve_count += 1
 
-        # First pass to transform all points at once
-        transformed_points = []
-        for point in bezier_points:
-            co, hl, hr = [
-                matrix @ v for v in (point.co, point.handle_left, point.handle_right)
-            ]
-            transformed_points.append(
-                {
-                    "co": GPointF(co.x, co.y),
-                    "hl": GPointF(hl.x, hl.y),
-                    "hr": GPointF(hr.x, hr.y),
-                }
-            )
+            types = np.full(curve_count + 1, SegmentType.CURVE, dtype=np.uint8)
+            types[0] = SegmentType.MOVE
+            results.append({"types": types, "points": np.concatenate(parts)})
 
-        # Second pass to create segments (more efficient with points already transformed)
-        first_point = transformed_points[0]
-        spline_points.append({"type": "M", "points": [first_point["co"]]})
-        all_points.append(first_point["co"])
-
-        # Process intermediate points
-        for i in range(1, len(transformed_points)):
-            prev_point = transformed_points[i - 1]
-            curr_point = transformed_points[i]
-
-            spline_points.append(
-                {
-                    "type": "C",
-                    "points": [prev_point["hr"], curr_point["hl"], curr_point["co"]],
-                }
-            )
-            all_points.append(curr_point["co"])
-
-        # Close the curve if cyclic
-        if use_cyclic and transformed_points:
-            last_point = transformed_points[-1]
-            spline_points.append(
-                {
-                    "type": "C",
-                    "points": [last_point["hr"], first_point["hl"], first_point["co"]],
-                }
-            )
+        return results
 
     @staticmethod
-    def _process_poly_spline(spline, matrix, spline_points, all_points):
+    def _process_poly_spline(spline, matrix, anchors_out):
         """
         Process a poly spline into path segments.
 
         Args:
             spline: Blender poly spline to process
             matrix: World transformation matrix to apply
-            spline_points: List to store the resulting path segments
-            all_points: List to store all processed points (for bounds calculation)
+            anchors_out: (N, 2) array view that receives the transformed anchor
+                points (for bounds calculation)
+
+        Returns:
+            Spline dictionary with "types" and "points" arrays (see
+            _process_bezier_splines), or None if the spline has no points
         """
         points = spline.points
         use_cyclic = spline.use_cyclic_u
 
         if not points:
-            return
-
-        # Precompute transformations for all points
-        transformed_points = []
-        for point in points:
-            co = matrix @ point.co.to_3d()
-            transformed_points.append(GPointF(co.x, co.y))
-
-        # First point is a move
-        first_point = transformed_points[0]
-        spline_points.append({"type": "M", "points": [first_point]})
-        all_points.append(first_point)
-
-        # Remaining points are lines
-        for i in range(1, len(transformed_points)):
-            pt = transformed_points[i]
-            spline_points.append({"type": "L", "points": [pt]})
-            all_points.append(pt)
-
-        # Close the curve if cyclic
-        if use_cyclic and transformed_points:
-            spline_points.append({"type": "L", "points": [first_point]})
+            return None
+
+        # Read all homogeneous coordinates at once (float32, as stored by
+        # Blender) and drop W (poly splines store NURBS weights there, not a
+        # projective coordinate)
+        count = len(points)
+        buffer = np.empty(count * 4, dtype=np.float32)
+        points.foreach_get("co", buffer)
+        co = buffer.reshape(count, 4)[:, :3]
+
+        # Apply the affine part of the world matrix in one batched product,
+        # keeping only the X/Y output rows
+        world = np.asarray(matrix, dtype=np.float32)
+        xy = np.matmul(co, world[:2, :3].T, out=anchors_out)
+        xy += world[:2, 3]
+
+        # First point is a move, remaining points are lines; a cyclic spline
+        # closes with a line back to the first point
+        if use_cyclic:
+            xy = np.concatenate((xy, xy[:1]))
+        types = np.full(len(xy), SegmentType.LINE, dtype=np.uint8)
+        types[0] = SegmentType.MOVE
+        return {"types": types, "points": xy}
 
     @staticmethod
     def normalize_curves(
@@ -145,8 +170,12 @@ class CurveProcessor:
         offset_x = center.x if center_at_origin else bounds.left
         offset_y = center.y if center_at_origin else bounds.top
 
-        # Create cache key
-        cache_key = f"normalize_{hash(str(curve_data))}_{center_at_origin}"
+        # Create cache key from the content fingerprint (no stringified dict)
+        cache_key = (
+            "normalize",
+            CurveProcessor._get_fingerprint(curve_data),
+            center_at_origin,
+        )
 
         # Check cache
         cached_result = geometry_cache.get(cache_key)
@@ -154,28 +183,27 @@ class CurveProcessor:
             return cached_result
 
         normalized_data = []
+        curves = curve_data.get("curves", [])
+        splines = [spline for curve_obj in curves for spline in curve_obj]
+
+        # Shift every point of every spline with one broadcast subtraction,
+        # then hand each spline a view into the shared result. Promote to
+        # float64 here: the offset removes the large world coordinates and the
+        # SVG output may ask for up to 6 decimals.
+        if splines:
+            shifted = np.concatenate(
+                [spline["points"] for spline in splines], dtype=np.float64
+            )
+            shifted -= (offset_x, offset_y)
+            split_at = np.cumsum([len(spline["points"]) for spline in splines[:-1]])
+            shifted_points = iter(np.split(shifted, split_at))
 
         # Iterate through each curve object
-        for i, curve_obj in enumerate(curve_data.get("curves", [])):
-            obj_normalized_splines = []
-
-            # Iterate through each spline in the curve object
-            for spline in curve_obj:
-                normalized_segments = []
-
-                # Normalize each segment in the spline
-                for seg in spline:
-                    normalized_segments.append(
-                        {
-                            "type": seg["type"],
-                            "points": [
-                                GPointF(pt.x - offset_x, pt.y - offset_y)
-                                for pt in seg["points"]
-                            ],
-                        }
-                    )
-
-                obj_normalized_splines.append(normalized_segments)
+        for i, curve_obj in enumerate(curves):
+            obj_normalized_splines = [
+                {"types": spline["types"], "points": next(shifted_points)}
+                for spline in curve_obj
+            ]
 
             # Add style information if available
             curve_info = None
@@ -210,17 +238,28 @@ class CurveProcessor:
                 "center": GPointF(0, 0),
             }
 
-        bounds = curve_data["bounds"]
+        global _last_dimensions
+
+        # Reuse the last result while the same bounds and center objects are
+        # passed in (cached curve data is polled repeatedly). Callers get a
+        # copy, so editing the result can't leak into later calls.
+        bounds, center = curve_data["bounds"], curve_data["center"]
+        last_bounds, last_center, dimensions = _last_dimensions
+        if bounds is last_bounds and center is last_center:
+            return dict(dimensions)
+
         width = max(0.1, bounds.width())
         height = max(0.1, bounds.height())
 
-        return {
+        dimensions = {
             "width_orig": width,
             "height_orig": height,
             "width_svg": width,
             "height_svg": height,
-            "center": curve_data["center"],
+            "center": center,
         }
+        _last_dimensions = (bounds, center, dimensions)
+        return dict(dimensions)
 
     @staticmethod
     def simplify_curves(
@@ -241,8 +280,9 @@ class CurveProcessor:
         if not curve_data or not curve_data.get("valid", False):
             return curve_data
 
-        # Create cache key
-        cache_key = f"simplify_{hash(str(curve_data))}_{tolerance}"
+        # Create cache key from the content fingerprint (no stringified dict)
+        fingerprint = CurveProcessor._get_fingerprint(curve_data)
+        cache_key = ("simplify", fingerprint, tolerance)
 
         # Check cache
         cached_result = geometry_cache.get(cache_key)
@@ -257,84 +297,114 @@ class CurveProcessor:
 
             # Process each spline
             for spline in curve_obj:
-                simplified_spline = []
+                simplified_types = []
+                simplified_rows = []
                 points_to_simplify = []
 
-                # Extract points from spline
-                for seg in spline:
-                    if seg["type"] == "M":
+                # Walk the segments, slicing each one's points from the flat list
+                rows = spline["points"].tolist()
+                start = 0
+                for seg_type in spline["types"].tolist():
+                    end = start + SEGMENT_POINT_COUNTS[seg_type]
+                    seg_rows = rows[start:end]
+                    start = end
+
+                    if seg_type == SegmentType.MOVE:
                         # If there are accumulated points, simplify them first
                         if points_to_simplify:
                             CurveProcessor._add_simplified_points(
                                 points_to_simplify,
-                                simplified_spline,
+                                simplified_types,
+                                simplified_rows,
                                 tolerance,
                                 GeometryUtils.simplify_polyline,
                             )
                             points_to_simplify = []
 
                         # Add move point
-                        simplified_spline.append(seg)
-                        points_to_simplify.append(seg["points"][0])
-                    elif seg["type"] == "L":
+                        simplified_types.append(seg_type)
+                        simplified_rows.extend(seg_rows)
+                        points_to_simplify.append(GPointF(*seg_rows[0]))
+                    elif seg_type == SegmentType.LINE:
                         # Accumulate line points for simplification
-                        points_to_simplify.append(seg["points"][0])
-                    elif seg["type"] == "C":
+                        points_to_simplify.append(GPointF(*seg_rows[0]))
+                    elif seg_type == SegmentType.CURVE:
                         # Bezier curves aren't simplified directly
                         # If there are accumulated points, simplify them first
                         if points_to_simplify:
                             CurveProcessor._add_simplified_points(
                                 points_to_simplify,
-                                simplified_spline,
+                                simplified_types,
+                                simplified_rows,
                                 tolerance,
                                 GeometryUtils.simplify_polyline,
                             )
                             points_to_simplify = []
 
                         # Add Bezier curve segment
-                        simplified_spline.append(seg)
+                        simplified_types.append(seg_type)
+                        simplified_rows.extend(seg_rows)
 
                 # Process remaining points
                 if points_to_simplify:
                     CurveProcessor._add_simplified_points(
                         points_to_simplify,
-                        simplified_spline,
+                        simplified_types,
+                        simplified_rows,
                         tolerance,
                         GeometryUtils.simplify_polyline,
                     )
 
-                simplified_obj.append(simplified_spline)
+                simplified_obj.append(
+                    {
+                        "types": np.array(simplified_types, dtype=np.uint8),
+                        "points": np.array(simplified_rows, dtype=np.float32).reshape(
+                            -1, 2
+                        ),
+                    }
+                )
 
             simplified_curves.append(simplified_obj)
 
         # Create result with simplified curves
         result = curve_data.copy()
         result["curves"] = simplified_curves
+        result["_fingerprint"] = cache_key
 
         # Save to cache
         geometry_cache.set(cache_key, result)
         return result
 
     @staticmethod
-    def _add_simplified_points(points, simplified_spline, tolerance, simplify_func):
+    def _add_simplified_points(
+        points, simplified_types, simplified_rows, tolerance, simplify_func
+    ):
         """
         Add simplified points to a spline.
 
         Args:
             points: List of points to simplify
-            simplified_spline: List to add simplified segments to
+            simplified_types: List of segment type codes to append lines to
+            simplified_rows: List of [x, y] rows to append line points to
             tolerance: Tolerance for simplification
             simplify_func: Function to use for simplification
         """
         if len(points) <= 1:
             return
 
-        # Use simplification algorithm
+        if len(points) == 2:
+            # Nothing to remove between two points, skip the simplification
+            simplified_types.append(SegmentType.LINE)
+            simplified_rows.append([points[1].x, points[1].y])
+            return
+
+        # Use simplification algorithm (compiled when Numba is available)
         simplified = simplify_func(points, tolerance)
 
         # First point should already be included as 'M'
-        for i in range(1, len(simplified)):
-            simplified_spline.append({"type": "L", "points": [simplified[i]]})
+        for point in simplified[1:]:
+            simplified_types.append(SegmentType.LINE)
+            simplified_rows.append([point.x, point.y])
 
     @staticmethod
     def get_selected_curves(
@@ -368,9 +438,17 @@ class CurveProcessor:
                 "message": "No valid curve objects selected.",
             }
 
-        # Create cache key based on selected objects and their properties
-        cache_key = f"selected_curves_{'_'.join(obj.name for obj in selected_objects)}"
-        cache_key += f"_{hash(tuple((obj.matrix_world[i][j] for i in range(4) for j in range(4)) for obj in selected_objects))}"
+        # Create cache key based on selected objects and their transforms. All
+        # matrices are packed into one float32 array (Blender's own precision)
+        # and hashed as raw bytes.
+        matrices = np.array(
+            [obj.matrix_world for obj in selected_objects], dtype=np.float32
+        )
+        cache_key = (
+            "selected_curves",
+            "|".join(obj.name for obj in selected_objects),
+            hash(matrices.tobytes()),
+        )
 
         # Check cache if allowed
         if use_cache:
@@ -379,59 +457,22 @@ class CurveProcessor:
                 return cached_result
 
         all_curves_data = []  # List to store curve data by object
-        all_points = []  # Flat list of all points for bounds calculation
+        object_mins = []  # Per-object minimum X/Y for bounds calculation
+        object_maxs = []  # Per-object maximum X/Y for bounds calculation
         curves_info = []  # Style information for each curve
 
-        # Process each selected curve object
-        for obj in selected_objects:
-            matrix = obj.matrix_world
-            object_curves_data = []  # Store splines for this object
-            object_points = []  # Points for this object
-
-            # Process each spline in the curve object
-            for spline in obj.data.splines:
-                spline_points = []  # Store segments for this spline
-
-                # Process based on spline type
-                if spline.type == "BEZIER":
-                    CurveProcessor._process_bezier_spline(
-                        spline, matrix, spline_points, object_points
-                    )
-                else:
-                    CurveProcessor._process_poly_spline(
-                        spline, matrix, spline_points, object_points
-                    )
+        # Extract each object independently, then merge the results. This
+        # stays on the main thread: the bpy API is not safe to call from
+        # worker threads, and foreach_get holds the GIL while copying.
+        for extracted in map(CurveProcessor._extract_object, selected_objects):
+            if extracted is None:
+                continue
 
-                # Only add splines with points
-                if spline_points:
-                    object_curves_data.append(spline_points)
-
-            # Only add objects with valid data
-            if object_points:
-                all_curves_data.append(object_curves_data)
-                all_points.extend(object_points)
-
-                # Extract style information from object properties
-                curve_settings = {
-                    "name": obj.name,
-                    "fill_preset": obj.get("scaleform_fill_preset", "ACCESSIBLE"),
-                    "use_fill": obj.get("scaleform_use_fill", True),
-                    "fill_color": (
-                        obj.get("scaleform_fill_color_r", 0.6),
-                        obj.get("scaleform_fill_color_g", 0.6),
-                        obj.get("scaleform_fill_color_b", 0.6),
-                        obj.get("scaleform_fill_color_a", 1.0),
-                    ),
-                    "use_stroke": obj.get("scaleform_use_stroke", False),
-                    "stroke_color": (
-                        obj.get("scaleform_stroke_color_r", 0.25),
-                        obj.get("scaleform_stroke_color_g", 0.25),
-                        obj.get("scaleform_stroke_color_b", 0.25),
-                        obj.get("scaleform_stroke_color_a", 1.0),
-                    ),
-                    "stroke_width": obj.get("scaleform_stroke_width", 0.5),
-                }
-                curves_info.append(curve_settings)
+            object_curves_data, object_min, object_max, curve_settings = extracted
+            all_curves_data.append(object_curves_data)
+            object_mins.append(object_min)
+            object_maxs.append(object_max)
+            curves_info.append(curve_settings)
 
         # Prepare result dictionary
         result = {
@@ -443,13 +484,17 @@ class CurveProcessor:
         }
 
         # If we have points, calculate bounds and populate result
-        if all_points:
-            bounds = calculate_bounds(all_points)
+        if object_mins:
+            # Fold the per-object bounds instead of sweeping every point again
+            bounds = bounds_from_extents(object_mins, object_maxs)
             result["bounds"] = bounds
             result["center"] = bounds.center()
             result["curves"] = all_curves_data
             result["curves_info"] = curves_info
             result["valid"] = True
+            result["_fingerprint"] = CurveProcessor._fingerprint_curves(
+                all_curves_data, curves_info
+            )
         else:
             result["message"] = "No valid curve data found in selected objects."
 
@@ -459,6 +504,130 @@ class CurveProcessor:
 
         return result
 
+    @staticmethod
+    def _extract_object(obj) -> Optional[Tuple[list, np.ndarray, np.ndarray, dict]]:
+        """
+        Extract the splines, bounds and style of one curve object.
+
+        Args:
+            obj: Blender curve object to process
+
+        Returns:
+            Tuple of (spline list, minimum X/Y, maximum X/Y, style settings),
+            or None if the object has no points
+        """
+        # Convert the world matrix once for every spline of this object
+        world = np.array(obj.matrix_world, dtype=np.float32)
+        splines = list(obj.data.splines)
+
+        # Partition the splines by type up front (reading each type once), so
+        # each processor runs in its own branch-free loop
+        is_bezier = [spline.type == "BEZIER" for spline in splines]
+        bezier_indices = [i for i, bezier in enumerate(is_bezier) if bezier]
+        poly_indices = [i for i, bezier in enumerate(is_bezier) if not bezier]
+
+        # Count the anchor points up front so they can be written straight
+        # into one buffer instead of collected and concatenated
+        counts = [
+            len(spline.bezier_points if bezier else spline.points)
+            for spline, bezier in zip(splines, is_bezier)
+        ]
+        total = sum(counts)
+        if not total:
+            return None
+        object_xy = np.empty((total, 2), dtype=np.float32)
+        starts = np.cumsum([0] + counts).tolist()
+
+        # Process each group, storing results by index to keep spline order
+        results = [None] * len(splines)
+        bezier_results = CurveProcessor._process_bezier_splines(
+            [splines[i] for i in bezier_indices],
+            world,
+            [object_xy[starts[i] : starts[i + 1]] for i in bezier_indices],
+        )
+        for i, spline_data in zip(bezier_indices, bezier_results):
+            results[i] = spline_data
+        for i in poly_indices:
+            results[i] = CurveProcessor._process_poly_spline(
+                splines[i], world, object_xy[starts[i] : starts[i + 1]]
+            )
+
+        # Only add splines with points
+        object_curves_data = [data for data in results if data is not None]
+
+        # Extract style information from object properties, reading the ID
+        # properties once into a plain dict instead of one lookup per field
+        props = dict(obj.items())
+        curve_settings = {
+            "name": obj.name,
+            "fill_preset": props.get("scaleform_fill_preset", "ACCESSIBLE"),
+            "use_fill": props.get("scaleform_use_fill", True),
+            "fill_color": (
+                props.get("scaleform_fill_color_r", 0.6),
+                props.get("scaleform_fill_color_g", 0.6),
+                props.get("scaleform_fill_color_b", 0.6),
+                props.get("scaleform_fill_color_a", 1.0),
+            ),
+            "use_stroke": props.get("scaleform_use_stroke", False),
+            "stroke_color": (
+                props.get("scaleform_stroke_color_r", 0.25),
+                props.get("scaleform_stroke_color_g", 0.25),
+                props.get("scaleform_stroke_color_b", 0.25),
+                props.get("scaleform_stroke_color_a", 1.0),
+            ),
+            "stroke_width": props.get("scaleform_stroke_width", 0.5),
+        }
+
+        return (
+            object_curves_data,
+            object_xy.min(axis=0),
+            object_xy.max(axis=0),
+            curve_settings,
+        )
+
+    @staticmethod
+    def _fingerprint_curves(
+        curves: List[List[Dict[str, np.ndarray]]], curves_info: List[Dict[str, Any]]
+    ) -> bytes:
+        """
+        Compute a compact content fingerprint for extracted curve data.
+
+        Args:
+            curves: Curve data organized by object and spline
+            curves_info: Style information for each curve object
+
+        Returns:
+            16-byte digest of the segment types, coordinates and styles
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for curve_obj in curves:
+            digest.update(b"|")
+            for spline in curve_obj:
+                # Hash the raw array buffers, with a separator between splines
+                digest.update(spline["types"].tobytes())
+                digest.update(b":")
+                digest.update(spline["points"].tobytes())
+        digest.update(repr(curves_info).encode())
+        return digest.digest()
+
+    @staticmethod
+    def _get_fingerprint(curve_data: Dict[str, Any]) -> Any:
+        """
+        Return the fingerprint stored on curve data, computing it if missing.
+
+        Args:
+            curve_data: Dictionary with curve data from get_selected_curves
+
+        Returns:
+            Hashable fingerprint of the curve content
+        """
+        fingerprint = curve_data.get("_fingerprint")
+        if fingerprint is None:
+            fingerprint = CurveProcessor._fingerprint_curves(
+                curve_data.get("curves", []), curve_data.get("curves_info", [])
+            )
+        return fingerprint
+
     @staticmethod
     def force_refresh_curve_data(context) -> Dict[str, Any]:
         """
@@ -475,3 +644,4 @@ class CurveProcessor:
         """
         # Always get fresh data by passing use_cache=False
         return CurveProcessor.get_selected_curves(context, use_cache=False)
+
@@ -6,19 +6,20 @@ for processing Blender curves and converting between coordinate systems.
 """
 
 from .base import (
-    Vector2, Vector3, GPointF, GSizeF, GRectF, 
-    calculate_bounds, EPSILON
+    Vector2, Vector3, GPointF, GSizeF, GRectF, GPointArray,
+    calculate_bounds, bounds_from_extents, EPSILON
 )
 from .matrix import GMatrix2D, DEG_TO_RAD, RAD_TO_DEG
 from .utils import GeometryUtils
 
 __all__ = [
     # Base geometry classes
-    'Vector2', 'Vector3', 'GPointF', 'GSizeF', 'GRectF', 'EPSILON',
+    'Vector2', 'Vector3', 'GPointF', 'GSizeF', 'GRectF', 'GPointArray',
+    'EPSILON',
     
     # Matrix transformations
     'GMatrix2D', 'DEG_TO_RAD', 'RAD_TO_DEG',
     
     # Utility functions and classes
-    'GeometryUtils', 'calculate_bounds'
+    'GeometryUtils', 'calculate_bounds', 'bounds_from_extents'
 ]
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Numeric kernels for the geometry primitives.
+
+These functions hold the batched vector math behind the Vector3 *_many
+methods, the bounds reduction and polyline simplification. When Numba is
+installed they are compiled to native code; otherwise they run as plain
+Python with identical results.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cross_batch(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Compute row-wise cross products of two (N, 3) arrays into out.
+
+    Args:
+        a: Array of shape (N, 3) with the left-hand vectors
+        b: Array of shape (N, 3) with the right-hand vectors
+        out: Array of shape (N, 3) receiving the results
+    """
+    for i in prange(a.shape[0]):
+        out[i, 0] = a[i, 1] * b[i, 2] - a[i, 2] * b[i, 1]
+        out[i, 1] = a[i, 2] * b[i, 0] - a[i, 0] * b[i, 2]
+        out[i, 2] = a[i, 0] * b[i, 1] - a[i, 1] * b[i, 0]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def dot_batch(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Compute row-wise dot products of two (N, 3) arrays into out.
+
+    Args:
+        a: Array of shape (N, 3) with the left-hand vectors
+        b: Array of shape (N, 3) with the right-hand vectors
+        out: Array of shape (N,) receiving the results
+    """
+    for i in prange(a.shape[0]):
+        out[i] = a[i, 0] * b[i, 0] + a[i, 1] * b[i, 1] + a[i, 2] * b[i, 2]
+
+
+@njit(cache=True, fastmath=True)
+def bounds_xy(xy: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Find the X/Y extents of an (N, 2) coordinate array in a single pass.
+
+    Args:
+        xy: Non-empty array of shape (N, 2) with X/Y coordinates
+
+    Returns:
+        Tuple of (min_x, min_y, max_x, max_y)
+    """
+    min_x = max_x = xy[0, 0]
+    min_y = max_y = xy[0, 1]
+    for i in range(1, xy.shape[0]):
+        x = xy[i, 0]
+        y = xy[i, 1]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return min_x, min_y, max_x, max_y
+
+
+# No fastmath here: the comparisons must match the recursive simplification
+@njit(cache=True)
+def rdp_keep_mask(xs: np.ndarray, ys: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker simplification over coordinate arrays.
+
+    Uses an explicit stack instead of recursion and compares squared
+    perpendicular distances, so no square roots are taken per point.
+
+    Args:
+        xs: X coordinates of the polyline
+        ys: Y coordinates of the polyline
+        tolerance: Simplification tolerance (higher = more simplified)
+
+    Returns:
+        Boolean mask of the points to keep
+    """
+    n = xs.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return keep
+    keep[0] = True
+    keep[n - 1] = True
+
+    tolerance_sq = max(tolerance, 0.0) ** 2
+    stack = [(0, n - 1)]
+    while len(stack) > 0:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        x0 = xs[start]
+        y0 = ys[start]
+        dx = xs[end] - x0
+        dy = ys[end] - y0
+        length_sq = dx * dx + dy * dy
+
+        # Find the point farthest from the line through the endpoints
+        # (distance to the start point when the endpoints coincide)
+        max_dist_sq = 0.0
+        index = start
+        for k in range(start + 1, end):
+            px = xs[k] - x0
+            py = ys[k] - y0
+            if length_sq == 0.0:
+                dist_sq = px * px + py * py
+            else:
+                cross = dy * px - dx * py
+                dist_sq = cross * cross / length_sq
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                index = k
+
+        # Keep the farthest point and simplify both halves around it
+        if max_dist_sq > tolerance_sq:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    return keep
@@ -6,12 +6,28 @@ for coordinate calculations, transformations, and bounds determination.
 """
 
 import math
+from itertools import chain
+from operator import attrgetter
 import numpy as np
-from typing import List, Tuple, Optional, Union
+from typing import List, Sequence, Tuple, Optional, Union
 from mathutils import Vector
 
+from ._numba_kernels import (
+    NUMBA_AVAILABLE,
+    bounds_xy,
+    cross_batch,
+    dot_batch,
+)
+
 # Small value for floating-point comparisons
 EPSILON = 1e-6
+EPSILON_SQ = EPSILON * EPSILON
+
+# 64-bit golden ratio constant used to mix quantized coordinates in __hash__
+_HASH_MIX = 0x9E3779B97F4A7C15
+
+# Fetches (x, y) from a point object in one C-level call
+_GET_XY = attrgetter("x", "y")
 
 
 class Vector2:
@@ -19,9 +35,12 @@ class Vector2:
     2D vector representation with x and y components.
 
     Used for 2D coordinate operations and transformations throughout
-    the minimap calculations.
+    the minimap calculations. The hash is cached on first use, so do not
+    change the coordinates of a vector used as a dict key.
     """
 
+    __slots__ = ["x", "y", "_hash"]
+
     def __init__(self, x: float, y: float):
         """
         Initialize a new Vector2.
@@ -32,20 +51,32 @@ class Vector2:
         """
         self.x = x
         self.y = y
+        self._hash = -1
 
     def __repr__(self) -> str:
         """String representation of the vector."""
         return f"Vector2({self.x:.2f}, {self.y:.2f})"
 
     def __eq__(self, other) -> bool:
-        """Check if two vectors are equal (within epsilon)."""
+        """Check if two vectors are equal (within epsilon distance)."""
         if not isinstance(other, Vector2):
             return False
-        return abs(self.x - other.x) < EPSILON and abs(self.y - other.y) < EPSILON
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy < EPSILON_SQ
 
     def __hash__(self) -> int:
-        """Hash implementation for dict keys."""
-        return hash((round(self.x, 3), round(self.y, 3)))
+        """Hash implementation for dict keys (computed once, then cached)."""
+        h = self._hash
+        if h == -1:
+            try:
+                # Round to the nearest point of a 0.001 grid and mix the integers
+                h = hash((round(self.x * 1000.0) * _HASH_MIX) ^ round(self.y * 1000.0))
+            except (ValueError, OverflowError):
+                # NaN or infinite coordinates have no grid point
+                h = hash((self.x, self.y))
+            self._hash = h
+        return h
 
     def length(self) -> float:
         """Calculate vector length (magnitude)."""
@@ -61,6 +92,12 @@ class Vector2:
         dy = self.y - other.y
         return math.sqrt(dx * dx + dy * dy)
 
+    def distance_squared_to(self, other: "Vector2") -> float:
+        """Calculate squared distance to another vector (no square root)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
     def normalize(self) -> "Vector2":
         """Return a normalized version of the vector (unit length)."""
         length = self.length()
@@ -95,9 +132,12 @@ class Vector3:
     3D vector representation with x, y, and z components.
 
     Used for 3D coordinate operations in world-space before conversion
-    to Scaleform coordinates.
+    to Scaleform coordinates. The hash is cached on first use, so do not
+    change the coordinates of a vector used as a dict key.
     """
 
+    __slots__ = ["x", "y", "z", "_hash"]
+
     def __init__(self, x: float, y: float, z: float):
         """
         Initialize a new Vector3.
@@ -110,6 +150,7 @@ class Vector3:
         self.x = x
         self.y = y
         self.z = z
+        self._hash = -1
 
     def __add__(self, other: "Vector3") -> "Vector3":
         """Add two vectors."""
@@ -124,18 +165,27 @@ class Vector3:
         return Vector3(self.x * scalar, self.y * scalar, self.z * scalar)
 
     def __eq__(self, other) -> bool:
-        """Check if two vectors are equal (within epsilon)."""
+        """Check if two vectors are equal (within epsilon distance)."""
         if not isinstance(other, Vector3):
             return False
-        return (
-            abs(self.x - other.x) < EPSILON
-            and abs(self.y - other.y) < EPSILON
-            and abs(self.z - other.z) < EPSILON
-        )
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx * dx + dy * dy + dz * dz < EPSILON_SQ
 
     def __hash__(self) -> int:
-        """Hash implementation for dict keys."""
-        return hash((round(self.x, 3), round(self.y, 3), round(self.z, 3)))
+        """Hash implementation for dict keys (computed once, then cached)."""
+        h = self._hash
+        if h == -1:
+            try:
+                # Round to the nearest point of a 0.001 grid and mix the integers
+                xy = (round(self.x * 1000.0) * _HASH_MIX) ^ round(self.y * 1000.0)
+                h = hash((xy * _HASH_MIX) ^ round(self.z * 1000.0))
+            except (ValueError, OverflowError):
+                # NaN or infinite coordinates have no grid point
+                h = hash((self.x, self.y, self.z))
+            self._hash = h
+        return h
 
     def dot(self, other: "Vector3") -> float:
         """Calculate dot product with another vector."""
@@ -149,10 +199,82 @@ class Vector3:
             self.x * other.y - self.y * other.x,
         )
 
+    @staticmethod
+    def stack(vectors: Sequence["Vector3"]) -> np.ndarray:
+        """
+        Pack vectors into one (N, 3) array for the batch methods.
+
+        Args:
+            vectors: Vectors to pack
+
+        Returns:
+            Array of shape (N, 3) with one row per vector
+        """
+        return np.fromiter(
+            (c for v in vectors for c in (v.x, v.y, v.z)),
+            dtype=np.float64,
+            count=3 * len(vectors),
+        ).reshape(-1, 3)
+
+    @staticmethod
+    def cross_many(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Calculate the cross products of many vector pairs at once.
+
+        Args:
+            a: Array of shape (N, 3) with the left-hand vectors
+            b: Array of shape (N, 3) with the right-hand vectors
+
+        Returns:
+            Array of shape (N, 3) with the cross product of each row pair
+        """
+        a = np.ascontiguousarray(a, dtype=np.float64)
+        b = np.ascontiguousarray(b, dtype=np.float64)
+        if not NUMBA_AVAILABLE:
+            return np.cross(a, b)
+        out = np.empty_like(a)
+        cross_batch(a, b, out)
+        return out
+
+    @staticmethod
+    def dot_many(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Calculate the dot products of many vector pairs at once.
+
+        Args:
+            a: Array of shape (N, 3) with the left-hand vectors
+            b: Array of shape (N, 3) with the right-hand vectors
+
+        Returns:
+            Array of shape (N,) with the dot product of each row pair
+        """
+        a = np.ascontiguousarray(a, dtype=np.float64)
+        b = np.ascontiguousarray(b, dtype=np.float64)
+        if not NUMBA_AVAILABLE:
+            return np.einsum("ij,ij->i", a, b)
+        out = np.empty(a.shape[0], dtype=np.float64)
+        dot_batch(a, b, out)
+        return out
+
     def length(self) -> float:
         """Calculate vector length (magnitude)."""
         return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
+    def length_squared(self) -> float:
+        """Calculate squared length (more efficient for comparisons)."""
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def distance_to(self, other: "Vector3") -> float:
+        """Calculate distance to another vector."""
+        return math.sqrt(self.distance_squared_to(other))
+
+    def distance_squared_to(self, other: "Vector3") -> float:
+        """Calculate squared distance to another vector (no square root)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx * dx + dy * dy + dz * dz
+
     def normalize(self) -> "Vector3":
         """Return a normalized vector (unit length)."""
         length = self.length()
@@ -183,9 +305,13 @@ class GPointF:
     """
     2D point representation with floating-point coordinates.
 
-    Used primarily for path generation and SVG output coordinates.
+    Used primarily for path generation and SVG output coordinates. The hash
+    is cached on first use, so do not change the coordinates of a point used
+    as a dict key.
     """
 
+    __slots__ = ["x", "y", "_hash"]
+
     def __init__(self, x: float = 0.0, y: float = 0.0):
         """
         Initialize a new GPointF.
@@ -196,16 +322,28 @@ class GPointF:
         """
         self.x = x
         self.y = y
+        self._hash = -1
 
     def __eq__(self, other) -> bool:
-        """Check if two points are equal (within epsilon)."""
+        """Check if two points are equal (within epsilon distance)."""
         if not isinstance(other, GPointF):
             return False
-        return abs(self.x - other.x) < EPSILON and abs(self.y - other.y) < EPSILON
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy < EPSILON_SQ
 
     def __hash__(self) -> int:
-        """Hash implementation for dict keys."""
-        return hash((round(self.x, 3), round(self.y, 3)))
+        """Hash implementation for dict keys (computed once, then cached)."""
+        h = self._hash
+        if h == -1:
+            try:
+                # Round to the nearest point of a 0.001 grid and mix the integers
+                h = hash((round(self.x * 1000.0) * _HASH_MIX) ^ round(self.y * 1000.0))
+            except (ValueError, OverflowError):
+                # NaN or infinite coordinates have no grid point
+                h = hash((self.x, self.y))
+            self._hash = h
+        return h
 
     def to_vector2(self) -> Vector2:
         """Convert to Vector2."""
@@ -217,6 +355,12 @@ class GPointF:
         dy = self.y - other.y
         return math.sqrt(dx * dx + dy * dy)
 
+    def distance_squared_to(self, other: "GPointF") -> float:
+        """Calculate squared distance to another point (no square root)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
     def __repr__(self) -> str:
         """String representation of the point."""
         return f"GPointF({self.x:.2f}, {self.y:.2f})"
@@ -229,6 +373,8 @@ class GSizeF:
     Used for dimensions and scaling operations.
     """
 
+    __slots__ = ["width", "height"]
+
     def __init__(self, width: float = 0.0, height: float = 0.0):
         """
         Initialize a new GSizeF.
@@ -262,6 +408,8 @@ class GRectF:
     Used for bounds calculations and region operations.
     """
 
+    __slots__ = ["left", "top", "right", "bottom"]
+
     def __init__(
         self,
         left: float = 0.0,
@@ -353,7 +501,28 @@ class GRectF:
 
     def scale(self, sx: float, sy: float = None) -> "GRectF":
         """Scale the rectangle by the given factors."""
-        sy = sx if sy is None else sy
+        if sy is None:
+            return self.scale_uniform(sx)
+        return self._scale_xy(sx, sy)
+
+    def scale_uniform(self, s: float) -> "GRectF":
+        """Scale the rectangle by the same factor on both axes."""
+        half_s = s * 0.5
+        left, top, right, bottom = self.left, self.top, self.right, self.bottom
+        center_x = (left + right) * 0.5
+        center_y = (top + bottom) * 0.5
+        half_width = (right - left) * half_s
+        half_height = (bottom - top) * half_s
+
+        return GRectF(
+            center_x - half_width,
+            center_y - half_height,
+            center_x + half_width,
+            center_y + half_height,
+        )
+
+    def _scale_xy(self, sx: float, sy: float) -> "GRectF":
+        """Scale the rectangle by separate X and Y factors."""
         center_x = (self.left + self.right) * 0.5
         center_y = (self.top + self.bottom) * 0.5
         half_width = (self.right - self.left) * 0.5 * sx
@@ -371,35 +540,148 @@ class GRectF:
         return f"GRectF({self.left:.2f}, {self.top:.2f}, {self.right:.2f}, {self.bottom:.2f})"
 
 
-def calculate_bounds(points: List[GPointF]) -> GRectF:
+class GPointArray:
+    """
+    Batch of 2D points stored as one contiguous (N, 2) coordinate array.
+
+    Used instead of a list of GPointF when many points are processed
+    together, so operations like bounds run on the array without creating
+    a Python object per point.
+    """
+
+    __slots__ = ["xy"]
+
+    def __init__(self, n: int = 0):
+        """
+        Initialize a new GPointArray with uninitialized coordinates.
+
+        Args:
+            n: Number of points (default: 0)
+        """
+        self.xy = np.empty((n, 2), dtype=np.float64)
+
+    @classmethod
+    def from_points(cls, points: Sequence[GPointF]) -> "GPointArray":
+        """
+        Create a GPointArray from point objects.
+
+        Args:
+            points: Points with x and y attributes
+
+        Returns:
+            New GPointArray holding the points' coordinates
+        """
+        # attrgetter and chain run the whole scan in C, with no bytecode
+        # executed per point
+        result = cls.__new__(cls)
+        result.xy = np.fromiter(
+            chain.from_iterable(map(_GET_XY, points)),
+            dtype=np.float64,
+            count=2 * len(points),
+        ).reshape(-1, 2)
+        return result
+
+    @classmethod
+    def from_array(cls, xy: np.ndarray) -> "GPointArray":
+        """
+        Wrap an existing (N, 2) coordinate array without copying when possible.
+
+        Args:
+            xy: Array of X/Y coordinates
+
+        Returns:
+            New GPointArray backed by the array
+        """
+        result = cls.__new__(cls)
+        result.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        return result
+
+    def __len__(self) -> int:
+        """Number of points in the array."""
+        return self.xy.shape[0]
+
+    def __getitem__(self, index: int) -> GPointF:
+        """Return a single point as a GPointF."""
+        x, y = self.xy[index].tolist()
+        return GPointF(x, y)
+
+    def __repr__(self) -> str:
+        """String representation of the point array."""
+        return f"GPointArray({len(self)} points)"
+
+
+def calculate_bounds(
+    points: Union[List[GPointF], GPointArray, np.ndarray]
+) -> GRectF:
     """
     Calculate the bounding rectangle for a list of points.
 
     Args:
-        points: List of points to calculate bounds for
+        points: List of points, a GPointArray, or an (N, 2) array of X/Y
+            coordinates, to calculate bounds for
 
     Returns:
         Rectangle containing all points
     """
+    if isinstance(points, GPointArray):
+        points = points.xy
+
+    # Coordinate arrays reduce directly without touching point objects
+    if isinstance(points, np.ndarray):
+        if not len(points):
+            return GRectF()
+        # The compiled kernel finds all four extents in one pass
+        if NUMBA_AVAILABLE:
+            return GRectF(*bounds_xy(points))
+        return bounds_from_extents([points.min(axis=0)], [points.max(axis=0)])
+
     if not points:
         return GRectF()
 
-    # For large sets, using NumPy is faster
-    if len(points) > 100:
-        x_coords = np.array([p.x for p in points])
-        y_coords = np.array([p.y for p in points])
+    # Scan point objects directly at every size: packing them into an
+    # (N, 2) buffer first costs more than the whole scan, so there is no
+    # crossover. Callers that already hold coordinates in an array should
+    # pass it (or a GPointArray) instead.
+    # One pass updating four locals reads each coordinate once and creates
+    # no generator objects
+    it = iter(points)
+    p = next(it)
+    min_x = max_x = p.x
+    min_y = max_y = p.y
+    for p in it:
+        x = p.x
+        y = p.y
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+
+    return GRectF(min_x, min_y, max_x, max_y)
+
+
+def bounds_from_extents(
+    mins: Sequence[np.ndarray], maxs: Sequence[np.ndarray]
+) -> GRectF:
+    """
+    Merge partial bounds into one rectangle.
+
+    Each partial is the X/Y minimum and maximum of a group of points (for
+    example one curve object), so the merge only touches two values per group.
 
-        return GRectF(
-            float(np.min(x_coords)),
-            float(np.min(y_coords)),
-            float(np.max(x_coords)),
-            float(np.max(y_coords)),
-        )
-    else:
-        # For small sets, direct approach is faster
-        min_x = min(p.x for p in points)
-        min_y = min(p.y for p in points)
-        max_x = max(p.x for p in points)
-        max_y = max(p.y for p in points)
-
-        return GRectF(min_x, min_y, max_x, max_y)
+    Args:
+        mins: Per-group (min_x, min_y) arrays
+        maxs: Per-group (max_x, max_y) arrays
+
+    Returns:
+        Rectangle containing all groups
+    """
+    if not len(mins):
+        return GRectF()
+
+    min_x, min_y = np.minimum.reduce(mins).tolist()
+    max_x, max_y = np.maximum.reduce(maxs).tolist()
+    return GRectF(min_x, min_y, max_x, max_y)
@@ -6,55 +6,92 @@ between different coordinate systems (Blender, Scaleform, GTA V world).
 """
 
 import math
+from functools import lru_cache
 import numpy as np
 from typing import List, Tuple, Optional, Union
-from .base import GPointF, GRectF, EPSILON
+from .base import GPointF, GPointArray, GRectF, EPSILON
+from ..constants import MATH_PI
 
 # Constants for angle conversions
-MATH_PI = np.float64(3.14159265358979323846)
 DEG_TO_RAD = MATH_PI / 180.0
 RAD_TO_DEG = 180.0 / MATH_PI
 
 
+@lru_cache(maxsize=64)
+def _cos_sin(angle_rad: float) -> Tuple[float, float]:
+    """Return (cos, sin) of an angle, cached since the same angles recur."""
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
 class GMatrix2D:
     """
     Optimized 2D transformation matrix for coordinate conversions.
 
     This class provides methods for 2D affine transformations
     including scaling, rotation, and translation operations.
+
+    The matrix is stored as six scalars in row-major order,
+    [[a, b, c], [d, e, f]], so single-point operations never touch NumPy.
     """
 
-    __slots__ = ["M"]
+    __slots__ = ["a", "b", "c", "d", "e", "f"]
 
-    # Identity matrix for reference
+    # Identity matrix for reference; shared, so read-only (use .copy() to edit)
     IDENTITY = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+    IDENTITY.flags.writeable = False
 
     def __init__(self):
         """Initialize as identity matrix."""
-        self.M = np.copy(self.IDENTITY)
+        self.a, self.b, self.c = 1.0, 0.0, 0.0
+        self.d, self.e, self.f = 0.0, 1.0, 0.0
+
+    @property
+    def M(self) -> np.ndarray:
+        """
+        The matrix as a new read-only 2x3 NumPy array.
+
+        The array is a snapshot of the scalar coefficients, so it is not
+        writeable; in-place writes such as m.M[0, 2] = tx raise instead of
+        being silently lost. Assign a whole array to M to change the matrix.
+        """
+        array = np.array([[self.a, self.b, self.c], [self.d, self.e, self.f]])
+        array.flags.writeable = False
+        return array
+
+    @M.setter
+    def M(self, array: np.ndarray) -> None:
+        """Set the matrix from a 2x3 array."""
+        (self.a, self.b, self.c), (self.d, self.e, self.f) = np.asarray(
+            array, dtype=np.float64
+        )[:2, :3].tolist()
 
     def append_scaling(self, sx: float, sy: float = None) -> "GMatrix2D":
         """Apply a scaling transformation to the matrix."""
         sy = sx if sy is None else sy
-        # Use np.matmul for matrix multiplication (faster)
-        scale = np.array([[sx, 0, 0], [0, sy, 0], [0, 0, 1]], dtype=np.float32)
-        self.M = np.matmul(np.vstack([self.M, [0, 0, 1]]), scale)[:2, :]
+        # M @ diag(sx, sy, 1) only scales the first two columns
+        self.a *= sx
+        self.d *= sx
+        self.b *= sy
+        self.e *= sy
         return self
 
     def append_translation(self, tx: float, ty: float) -> "GMatrix2D":
         """Apply a translation transformation to the matrix."""
-        translation = np.array([[1, 0, tx], [0, 1, ty], [0, 0, 1]], dtype=np.float32)
-        self.M = np.matmul(np.vstack([self.M, [0, 0, 1]]), translation)[:2, :]
+        # M @ T only moves the translation column by the linear part applied
+        # to (tx, ty)
+        self.c += self.a * tx + self.b * ty
+        self.f += self.d * tx + self.e * ty
         return self
 
     def append_rotation(self, angle_rad: float) -> "GMatrix2D":
         """Apply a rotation transformation to the matrix."""
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        rotation = np.array(
-            [[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]], dtype=np.float32
-        )
-        self.M = np.matmul(np.vstack([self.M, [0, 0, 1]]), rotation)[:2, :]
+        cos_a, sin_a = _cos_sin(angle_rad)
+        # M @ R mixes the first two columns; the translation is unchanged
+        a, b, d, e = self.a, self.b, self.d, self.e
+        self.a = a * cos_a + b * sin_a
+        self.b = b * cos_a - a * sin_a
+        self.d = d * cos_a + e * sin_a
+        self.e = e * cos_a - d * sin_a
         return self
 
     def rotate_degrees(self, angle_deg: float) -> "GMatrix2D":
@@ -63,44 +100,65 @@ class GMatrix2D:
 
     def transform(self, point: GPointF) -> GPointF:
         """Transform a point with this matrix."""
-        # Use direct multiplication instead of matrix ops for better performance
-        x = self.M[0, 0] * point.x + self.M[0, 1] * point.y + self.M[0, 2]
-        y = self.M[1, 0] * point.x + self.M[1, 1] * point.y + self.M[1, 2]
-        return GPointF(x, y)
+        x, y = point.x, point.y
+        return GPointF(
+            self.a * x + self.b * y + self.c, self.d * x + self.e * y + self.f
+        )
 
     def transform_points(self, points: List[GPointF]) -> List[GPointF]:
         """Transform multiple points in a batch operation."""
         if not points:
             return []
 
-        # Convert points to a matrix for batch transformation
-        points_array = np.array([[p.x, p.y, 1] for p in points], dtype=np.float32)
-
-        # Transform all points at once
-        transformed = np.dot(points_array, np.vstack([self.M, [0, 0, 1]]).T)
+        # Pack the coordinates once and transform them as two columns
+        xy = GPointArray.from_points(points).xy
+        new_x, new_y = self.transform_points_xy(xy[:, 0], xy[:, 1])
 
         # Convert back to GPointF
-        return [GPointF(p[0], p[1]) for p in transformed]
+        return [GPointF(x, y) for x, y in zip(new_x.tolist(), new_y.tolist())]
 
-    def transform_rect(self, rect: GRectF) -> GRectF:
-        """Transform a rectangle with this matrix."""
-        # Convert the four corners
-        corners = [
-            GPointF(rect.left, rect.top),
-            GPointF(rect.right, rect.top),
-            GPointF(rect.right, rect.bottom),
-            GPointF(rect.left, rect.bottom),
-        ]
+    def transform_points_xy(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transform points given as separate X and Y coordinate arrays.
 
-        transformed = self.transform_points(corners)
+        Array form of transform_points for callers that already hold their
+        coordinates in arrays; no point objects are created.
 
-        # Find the rectangle that contains all transformed points
-        min_x = min(p.x for p in transformed)
-        min_y = min(p.y for p in transformed)
-        max_x = max(p.x for p in transformed)
-        max_y = max(p.y for p in transformed)
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
 
-        return GRectF(min_x, min_y, max_x, max_y)
+        Returns:
+            Tuple of (transformed X array, transformed Y array)
+        """
+        # An affine map only needs the 2x2 part plus the translation, so
+        # there is no homogeneous coordinate column to build
+        return (
+            self.a * xs + self.b * ys + self.c,
+            self.d * xs + self.e * ys + self.f,
+        )
+
+    def transform_rect(self, rect: GRectF) -> GRectF:
+        """Transform a rectangle with this matrix."""
+        # For an affine map, each output axis is a sum of independent terms
+        # in x and y, so the extremes of the transformed corners come from
+        # the smaller/larger product per term (no corner points needed)
+        a, b, d, e = self.a, self.b, self.d, self.e
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+        ax0, ax1 = a * left, a * right
+        by0, by1 = b * top, b * bottom
+        dx0, dx1 = d * left, d * right
+        ey0, ey1 = e * top, e * bottom
+
+        return GRectF(
+            min(ax0, ax1) + min(by0, by1) + self.c,
+            min(dx0, dx1) + min(ey0, ey1) + self.f,
+            max(ax0, ax1) + max(by0, by1) + self.c,
+            max(dx0, dx1) + max(ey0, ey1) + self.f,
+        )
 
     def invert(self) -> bool:
         """
@@ -109,78 +167,102 @@ class GMatrix2D:
         Returns:
             True if inversion was successful, False if the matrix is singular
         """
-        # Add the missing row to make a 3x3 matrix
-        full_matrix = np.vstack([self.M, [0, 0, 1]])
-
-        try:
-            # Calculate the inverse
-            inverse = np.linalg.inv(full_matrix)
-            # Extract the first two rows
-            self.M = inverse[:2, :]
-            return True
-        except np.linalg.LinAlgError:
-            # Matrix is not invertible, return identity
-            result.M = np.copy(self.IDENTITY)
+        det = self.a * self.e - self.b * self.d
+        if det == 0.0:
+            # Matrix is singular, reset to identity. Only an exact zero is
+            # refused: the determinant scales with the matrix entries, so a
+            # fixed tolerance would reject valid small-scale matrices.
+            self.set_identity()
+            return False
 
-        return result
+        # Closed-form affine inverse: invert the 2x2 part, then map the
+        # translation through it
+        inv_det = 1.0 / det
+        a = self.e * inv_det
+        b = -self.b * inv_det
+        d = -self.d * inv_det
+        e = self.a * inv_det
+        c, f = self.c, self.f
+        self.a, self.b, self.c = a, b, -(a * c + b * f)
+        self.d, self.e, self.f = d, e, -(d * c + e * f)
+        return True
 
     def copy(self) -> "GMatrix2D":
         """Create a copy of this matrix."""
-        result = GMatrix2D()
-        result.M = np.copy(self.M)
+        result = GMatrix2D.__new__(GMatrix2D)
+        result.a, result.b, result.c = self.a, self.b, self.c
+        result.d, result.e, result.f = self.d, self.e, self.f
         return result
 
     def set_identity(self) -> "GMatrix2D":
         """Reset the matrix to identity."""
-        self.M = np.copy(self.IDENTITY)
+        self.a, self.b, self.c = 1.0, 0.0, 0.0
+        self.d, self.e, self.f = 0.0, 1.0, 0.0
         return self
 
     def determinant(self) -> float:
         """Calculate the determinant of the 2x2 matrix (ignoring translation)."""
-        return self.M[0, 0] * self.M[1, 1] - self.M[0, 1] * self.M[1, 0]
+        return self.a * self.e - self.b * self.d
 
     def get_scale(self) -> Tuple[float, float]:
         """Extract scale factors from the matrix."""
         # Scale is given by the magnitude of the columns
-        scale_x = math.sqrt(self.M[0, 0] ** 2 + self.M[1, 0] ** 2)
-        scale_y = math.sqrt(self.M[0, 1] ** 2 + self.M[1, 1] ** 2)
-        return (scale_x, scale_y)
+        return (math.hypot(self.a, self.d), math.hypot(self.b, self.e))
 
     def get_translation(self) -> Tuple[float, float]:
         """Extract translation components from the matrix."""
-        return (self.M[0, 2], self.M[1, 2])
+        return (self.c, self.f)
 
     def get_rotation(self) -> float:
         """Extract rotation angle from the matrix in radians."""
         # Assuming no skew, only rotation and uniform scale
-        return math.atan2(self.M[1, 0], self.M[0, 0])
+        return math.atan2(self.d, self.a)
 
     def get_rotation_degrees(self) -> float:
         """Extract rotation angle from the matrix in degrees."""
         return self.get_rotation() * RAD_TO_DEG
 
-    def to_array(self) -> np.ndarray:
-        """Convert the matrix to a 3x3 NumPy array."""
-        return np.vstack([self.M, [0, 0, 1]])
+    def to_array(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert the matrix to a 3x3 NumPy array.
+
+        Args:
+            out: Optional 3x3 array to write into, so loops that serialize
+                many matrices can reuse one buffer instead of allocating
+
+        Returns:
+            The 3x3 homogeneous matrix (out, if it was given)
+        """
+        if out is None:
+            return np.array(
+                [[self.a, self.b, self.c], [self.d, self.e, self.f], [0.0, 0.0, 1.0]]
+            )
+        out[0, 0] = self.a
+        out[0, 1] = self.b
+        out[0, 2] = self.c
+        out[1, 0] = self.d
+        out[1, 1] = self.e
+        out[1, 2] = self.f
+        out[2, 0] = 0.0
+        out[2, 1] = 0.0
+        out[2, 2] = 1.0
+        return out
 
     @classmethod
     def from_array(cls, array: np.ndarray) -> "GMatrix2D":
         """Create a matrix from a 3x3 or 2x3 NumPy array."""
-        result = cls()
-        if array.shape == (3, 3):
-            result.M = array[:2, :]
-        elif array.shape == (2, 3):
-            result.M = array
-        else:
+        if array.shape not in ((3, 3), (2, 3)):
             raise ValueError(f"Incompatible matrix shape: {array.shape}")
+        result = cls.__new__(cls)
+        result.M = array
         return result
 
     @classmethod
     def create_translation(cls, tx: float, ty: float) -> "GMatrix2D":
         """Create a translation matrix."""
         result = cls()
-        result.M[0, 2] = tx
-        result.M[1, 2] = ty
+        result.c = tx
+        result.f = ty
         return result
 
     @classmethod
@@ -188,20 +270,19 @@ class GMatrix2D:
         """Create a scaling matrix."""
         sy = sx if sy is None else sy
         result = cls()
-        result.M[0, 0] = sx
-        result.M[1, 1] = sy
+        result.a = sx
+        result.e = sy
         return result
 
     @classmethod
     def create_rotation(cls, angle_rad: float) -> "GMatrix2D":
         """Create a rotation matrix."""
         result = cls()
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        result.M[0, 0] = cos_a
-        result.M[0, 1] = -sin_a
-        result.M[1, 0] = sin_a
-        result.M[1, 1] = cos_a
+        cos_a, sin_a = _cos_sin(angle_rad)
+        result.a = cos_a
+        result.b = -sin_a
+        result.d = sin_a
+        result.e = cos_a
         return result
 
     @classmethod
@@ -211,14 +292,16 @@ class GMatrix2D:
 
     def __mul__(self, other: "GMatrix2D") -> "GMatrix2D":
         """Multiply this matrix by another (composition of transformations)."""
-        result = GMatrix2D()
-        # Add the missing row to make 3x3 matrices
-        m1 = np.vstack([self.M, [0, 0, 1]])
-        m2 = np.vstack([other.M, [0, 0, 1]])
-        # Multiply
-        product = np.matmul(m1, m2)
-        # Extract the first two rows
-        result.M = product[:2, :]
+        # Expand the 2x3 affine product directly (the implicit third rows
+        # are [0, 0, 1])
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+        result = GMatrix2D.__new__(GMatrix2D)
+        result.a = a * other.a + b * other.d
+        result.b = a * other.b + b * other.e
+        result.c = a * other.c + b * other.f + c
+        result.d = d * other.a + e * other.d
+        result.e = d * other.b + e * other.e
+        result.f = d * other.c + e * other.f + f
         return result
 
     def __eq__(self, other) -> bool:
@@ -226,11 +309,17 @@ class GMatrix2D:
         if not isinstance(other, GMatrix2D):
             return False
         # Compare with tolerance for floating point errors
-        return np.allclose(self.M, other.M, rtol=EPSILON, atol=EPSILON)
+        return all(
+            abs(x - y) <= EPSILON + EPSILON * abs(y)
+            for x, y in zip(
+                (self.a, self.b, self.c, self.d, self.e, self.f),
+                (other.a, other.b, other.c, other.d, other.e, other.f),
+            )
+        )
 
     def __repr__(self) -> str:
         """String representation of the matrix."""
         return (
-            f"GMatrix2D([{self.M[0, 0]:.2f}, {self.M[0, 1]:.2f}, {self.M[0, 2]:.2f}], "
-            f"[{self.M[1, 0]:.2f}, {self.M[1, 1]:.2f}, {self.M[1, 2]:.2f}])"
+            f"GMatrix2D([{self.a:.2f}, {self.b:.2f}, {self.c:.2f}], "
+            f"[{self.d:.2f}, {self.e:.2f}, {self.f:.2f}])"
         )
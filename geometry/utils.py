@@ -5,8 +5,19 @@ This module provides utility functions for geometry operations,
 transformations, and coordinate system conversions.
 """
 
+import math
+from functools import lru_cache
 from typing import List, Tuple, Any, Optional, Dict
-from ..geometry import GPointF, GRectF
+import numpy as np
+
+from .base import GPointF, GPointArray, GRectF, calculate_bounds
+from ._numba_kernels import NUMBA_AVAILABLE, rdp_keep_mask
+
+
+@lru_cache(maxsize=256)
+def _rgb8_to_hex(rgb: Tuple[int, int, int]) -> str:
+    """Format 8-bit RGB channels as a hex color, cached since palettes are small."""
+    return "#%02x%02x%02x" % rgb
 
 
 class GeometryUtils:
@@ -51,7 +62,7 @@ class GeometryUtils:
             List of 3D coordinates for drawing the arrow
         """
         # Normalize direction
-        dir_len = (direction.x**2 + direction.y**2) ** 0.5
+        dir_len = math.hypot(direction.x, direction.y)
         if dir_len < 0.0001:
             # Avoid division by zero
             dir_x, dir_y = 0, -1
@@ -102,8 +113,11 @@ class GeometryUtils:
         Returns:
             Hex color string (#RRGGBB)
         """
-        r, g, b = [int(c * 255) for c in rgba[:3]]
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Quantize before the lookup so colors that differ below 8 bits share
+        # one cache entry (Blender color properties aren't hashable anyway)
+        return _rgb8_to_hex(
+            (int(rgba[0] * 255), int(rgba[1] * 255), int(rgba[2] * 255))
+        )
 
     @staticmethod
     def format_coordinate(value, precision, use_comma):
@@ -119,16 +133,12 @@ class GeometryUtils:
             Formatted coordinate string
         """
         formatted = f"{value:.{precision}f}"
-        if use_comma:
-            formatted = formatted.replace(".", ",")
-        return formatted
+        return formatted.replace(".", ",") if use_comma else formatted
 
     @staticmethod
     def distance(point1, point2):
         """Calculate Euclidean distance between two points."""
-        dx = point2.x - point1.x
-        dy = point2.y - point1.y
-        return (dx**2 + dy**2) ** 0.5
+        return math.hypot(point2.x - point1.x, point2.y - point1.y)
 
     @staticmethod
     def simplify_polyline(points, tolerance=0.1):
@@ -145,26 +155,52 @@ class GeometryUtils:
         if len(points) <= 2:
             return points
 
-        # Find the point with the maximum distance
-        max_dist = 0
-        index = 0
-        for i in range(1, len(points) - 1):
-            # Calculate distance from point to line
-            dist = GeometryUtils._point_line_distance(points[i], points[0], points[-1])
-            if dist > max_dist:
-                max_dist = dist
-                index = i
-
-        # If max distance is greater than tolerance, recursively simplify
-        if max_dist > tolerance:
-            # Recursive call
-            first_half = GeometryUtils.simplify_polyline(points[: index + 1], tolerance)
-            second_half = GeometryUtils.simplify_polyline(points[index:], tolerance)
-
-            # Concat the two arrays
-            return first_half[:-1] + second_half
-        else:
-            return [points[0], points[-1]]
+        # Pack the coordinates once; both paths work on index ranges into
+        # these arrays instead of slicing the point list
+        xy = GPointArray.from_points(points).xy
+        xs = xy[:, 0]
+        ys = xy[:, 1]
+
+        if NUMBA_AVAILABLE:
+            # Run the compiled kernel and pick the kept points from the
+            # original list
+            keep = rdp_keep_mask(xs, ys, tolerance)
+            return [points[i] for i in np.flatnonzero(keep).tolist()]
+
+        n = len(points)
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+
+        # Explicit stack of (start, end) ranges instead of recursion
+        stack = [(0, n - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+
+            # Distances of the inner points to the line through the endpoints
+            # (to the start point when the endpoints coincide)
+            px = xs[start + 1 : end]
+            py = ys[start + 1 : end]
+            x0, y0, x1, y1 = xs[start], ys[start], xs[end], ys[end]
+            if x0 == x1 and y0 == y1:
+                dist = np.hypot(x0 - px, y0 - py)
+            else:
+                num = np.abs((y1 - y0) * px - (x1 - x0) * py + x1 * y0 - y1 * x0)
+                dist = num / math.hypot(x1 - x0, y1 - y0)
+
+            # Find the point with the maximum distance
+            offset = int(np.argmax(dist))
+
+            # If max distance is greater than tolerance, keep the point and
+            # simplify both halves around it
+            if dist[offset] > tolerance:
+                index = start + 1 + offset
+                keep[index] = True
+                stack.append((start, index))
+                stack.append((index, end))
+
+        return [points[i] for i in np.flatnonzero(keep).tolist()]
 
     @staticmethod
     def _point_line_distance(point, line_start, line_end):
@@ -190,9 +226,7 @@ class GeometryUtils:
             - line_end.y * line_start.x
         )
 
-        den = (
-            (line_end.y - line_start.y) ** 2 + (line_end.x - line_start.x) ** 2
-        ) ** 0.5
+        den = math.hypot(line_end.x - line_start.x, line_end.y - line_start.y)
 
         return num / den
 
@@ -213,8 +247,6 @@ class GeometryUtils:
 
         # Calculate bounds if no origin specified
         if origin is None:
-            from ..geometry import calculate_bounds
-
             bounds = calculate_bounds(points)
             origin = bounds.center()
 
@@ -234,8 +266,6 @@ class GeometryUtils:
         Returns:
             Rotated point
         """
-        import math
-
         # Default to origin if no center specified
         if center is None:
             center = GPointF(0, 0)
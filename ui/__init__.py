@@ -42,8 +42,8 @@ from .panels import (
     SCALEFORM_PT_minimap_settings,
 )
 
-# List of all classes that need to be registered with Blender
-classes = [
+# All classes that need to be registered with Blender, in order
+classes = (
     # Properties
     ScaleformCalculatorSettings,
     # Preferences
@@ -64,7 +64,7 @@ classes = [
     # Visualization operators
     SCALEFORM_OT_toggle_visualization,
     SCALEFORM_OT_update_visualization,
-]
+)
 
 
 def register():
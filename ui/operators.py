@@ -11,8 +11,6 @@ from bpy_extras.io_utils import ExportHelper
 from typing import Set, Dict, Any, List, Tuple, Optional
 
 from ..constants import WORLD_BOUNDS
-from ..core import MinimapCalculator, CurveProcessor, SVGExporter
-from ..geometry import Vector3, GPointF, GRectF
 from ..utils.helpers import copy_to_clipboard, apply_fill_preset, apply_stroke_settings
 
 
@@ -30,6 +28,10 @@ class SCALEFORM_OT_calculate_dimensions(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        # Core modules pull in NumPy, so they're loaded on first use
+        from ..core import MinimapCalculator, CurveProcessor
+        from ..geometry import Vector3
+
         # Process the selected curves
         curve_data = CurveProcessor.get_selected_curves(context)
         if not curve_data["valid"]:
@@ -109,6 +111,10 @@ class SCALEFORM_OT_calculate_position(Operator):
         return context.scene.scaleform_has_valid_data
 
     def execute(self, context):
+        # Core modules pull in NumPy, so they're loaded on first use
+        from ..core import MinimapCalculator, CurveProcessor
+        from ..geometry import Vector3
+
         # Process the selected curves
         curve_data = CurveProcessor.get_selected_curves(context)
         if not curve_data["valid"]:
@@ -190,6 +196,9 @@ class SCALEFORM_OT_export_svg(Operator, ExportHelper):
         return context.scene.scaleform_has_valid_data
 
     def execute(self, context):
+        from ..core import MinimapCalculator, CurveProcessor, SVGExporter
+        from ..geometry import Vector3
+
         # Get scene and settings
         scene, settings = context.scene, context.scene.scaleform_settings
 
@@ -229,11 +238,10 @@ class SCALEFORM_OT_export_svg(Operator, ExportHelper):
         # Using sample positions for demonstration (these would normally come from elsewhere)
         positions = [Vector3(1000.0, 2000.0, 50.0), Vector3(-500.0, 1500.0, 30.0)]
         minimap_data = calculator.generate_scaleform_data(positions)
-        minimap_coords = minimap_data["minimap_points"]
 
         # Generate SVG content
         svg_content = SVGExporter.generate_svg_content(
-            dimensions, normalized_curves, settings, minimap_coords
+            dimensions, normalized_curves, settings, minimap_data
         )
 
         # Export SVG file
@@ -341,6 +349,7 @@ class SCALEFORM_OT_apply_fill_settings(Operator):
         settings = context.scene.scaleform_settings
         
         # Clear cache to force fresh settings
+        from ..core import CurveProcessor
         from ..utils.cache import curve_cache
         curve_cache.clear()
 
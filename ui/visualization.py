@@ -22,10 +22,6 @@ from ..constants import (
     LINE_WIDTH,
     EXPORT_DIRECTION_COLOR,
 )
-from ..geometry import GPointF, GRectF
-from ..geometry.utils import GeometryUtils
-from ..core import CurveProcessor
-from ..utils.cache import curve_cache
 
 # Global variables for visualization
 _handle_3d = None
@@ -54,6 +50,11 @@ def clear_visualization_data():
     _handle_3d = None
 
 
+def is_visualization_active():
+    """Return True if the visualization is enabled or still holds data."""
+    return _visualization_enabled or bool(_visualization_data)
+
+
 def draw_3d_callback():
     """
     Callback function for 3D drawing.
@@ -502,26 +503,6 @@ def disable_visualization(context):
     
     return True
 
-def clear_visualization_data():
-    """
-    Clear all visualization data.
-    
-    This function resets the global visualization state variables, ensuring
-    that no data persists between scene changes or file loads.
-    """
-    global _visualization_data, _visualization_enabled, _handle_3d
-    
-    # Reset the data dictionary
-    _visualization_data = {}
-    
-    # Set enabled flag to False
-    _visualization_enabled = False
-    
-    # Clear the handle (if not already cleared by disable_visualization)
-    # We don't remove the draw handler here as that should be done by disable_visualization
-    # This is just a safety measure
-    _handle_3d = None
-
 
 def update_visualization_data(context):
     """Update visualization data based on selected curves."""
@@ -531,6 +512,7 @@ def update_visualization_data(context):
     _visualization_data = {}
 
     # Clear the cache to force recalculation
+    from ..core import CurveProcessor
     from ..utils.cache import curve_cache
     curve_cache.clear()
 
@@ -992,9 +974,9 @@ def unregister_visualization_properties():
 
 
 # Classes to register with Blender
-visualization_classes = [
+visualization_classes = (
     SCALEFORM_OT_toggle_visualization,
     SCALEFORM_OT_update_visualization,
     SCALEFORM_PT_visualization_panel,
     SCALEFORM_PersistentPreferences,
-]
\ No newline at end of file
+)
\ No newline at end of file
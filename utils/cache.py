@@ -7,7 +7,9 @@ storing and reusing results of expensive calculations.
 
 import time
 import gc
-from typing import Dict, Any, Callable, TypeVar, Generic, Optional, Tuple
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, TypeVar, Generic, Optional, Tuple
 
 from ..constants import DEFAULT_CACHE_LIFETIME, MAX_CACHE_SIZE
 
@@ -15,6 +17,9 @@ from ..constants import DEFAULT_CACHE_LIFETIME, MAX_CACHE_SIZE
 T = TypeVar("T")
 K = TypeVar("K")
 
+# Registry of live cache instances, used by clear_all_caches
+_CACHES: "weakref.WeakSet[Cache]" = weakref.WeakSet()
+
 
 class CacheItem(Generic[T]):
     """
@@ -55,7 +60,8 @@ class Cache(Generic[K, T]):
     Generic cache implementation with support for expiration and size limits.
 
     This class provides a key-value store with automatic expiration of items
-    and management of the cache size.
+    and management of the cache size. Entries are kept in access order, so
+    the least recently used ones are evicted first when the cache is full.
     """
 
     def __init__(
@@ -70,12 +76,15 @@ class Cache(Generic[K, T]):
             max_size: Maximum number of items before cleanup occurs
             default_lifetime: Default lifetime for items in seconds
         """
-        self._cache: Dict[K, CacheItem[T]] = {}
+        self._cache: "OrderedDict[K, CacheItem[T]]" = OrderedDict()
         self.max_size = max_size
         self.default_lifetime = default_lifetime
         self.hit_count = 0
         self.miss_count = 0
 
+        # Register so clear_all_caches picks this cache up automatically
+        _CACHES.add(self)
+
     def get(self, key: K) -> Optional[T]:
         """
         Get a value from the cache.
@@ -97,6 +106,7 @@ class Cache(Generic[K, T]):
             # Update statistics and return value
             self.hit_count += 1
             item.refresh()  # Update timestamp to extend lifetime
+            self._cache.move_to_end(key)  # Mark as most recently used
             return item.value
 
         self.miss_count += 1
@@ -112,11 +122,12 @@ class Cache(Generic[K, T]):
             lifetime: Custom lifetime in seconds (uses default if None)
         """
         # Check if we need to make space
-        if len(self._cache) >= self.max_size:
+        if key not in self._cache and len(self._cache) >= self.max_size:
             self._cleanup()
 
         actual_lifetime = lifetime if lifetime is not None else self.default_lifetime
         self._cache[key] = CacheItem(value, actual_lifetime)
+        self._cache.move_to_end(key)
 
     def _cleanup(self) -> None:
         """
@@ -129,25 +140,24 @@ class Cache(Generic[K, T]):
         for key in expired_keys:
             del self._cache[key]
 
-        # If we still need space, remove oldest items
-        if len(self._cache) >= self.max_size:
-            # Sort by timestamp (oldest first)
-            sorted_items = sorted(self._cache.items(), key=lambda x: x[1].timestamp)
-            # Remove 25% oldest or at least one item
-            items_to_remove = max(1, len(sorted_items) // 4)
-            for i in range(items_to_remove):
-                if i < len(sorted_items):
-                    del self._cache[sorted_items[i][0]]
+        # If we still need space, evict the least recently used items (the
+        # front of the ordered dict, so no sorting is needed)
+        while len(self._cache) >= self.max_size:
+            self._cache.popitem(last=False)
 
-    def clear(self) -> None:
+    def clear(self, collect: bool = True) -> None:
         """
         Clear the cache completely.
 
         This removes all items from the cache and forces garbage collection.
+
+        Args:
+            collect: Whether to run garbage collection after clearing
         """
         self._cache.clear()
         # Force memory release
-        gc.collect()
+        if collect:
+            gc.collect()
 
     def remove(self, key: K) -> bool:
         """
@@ -184,16 +194,17 @@ class Cache(Generic[K, T]):
         }
 
 
-# Global cache instances for different types of data
+# Global cache instances for different types of data. Keys are tuples
+# (hashed element-wise, no formatted strings), so they are typed as Hashable.
 
-# Cache for calculation results (general-purpose)
-calculation_cache = Cache[str, Any](max_size=200, default_lifetime=600)  # 10 minutes
+# Cache for calculation results (general-purpose, 10 minutes)
+calculation_cache = Cache[Hashable, Any](max_size=200, default_lifetime=600)
 
 # Cache for processed geometry (longer lifetime)
-geometry_cache = Cache[str, Any](max_size=100, default_lifetime=1800)  # 30 minutes
+geometry_cache = Cache[Hashable, Any](max_size=100, default_lifetime=1800)  # 30 minutes
 
 # Cache for selected curves (short lifetime)
-curve_cache = Cache[str, Any](max_size=50, default_lifetime=60)  # 1 minute
+curve_cache = Cache[Hashable, Any](max_size=50, default_lifetime=60)  # 1 minute
 
 
 def clear_all_caches() -> None:
@@ -202,27 +213,19 @@ def clear_all_caches() -> None:
 
     This is useful when forcing recalculations or freeing memory.
     """
-    try:
-        calculation_cache.clear()
-    except Exception as e:
-        print(f"Error clearing calculation cache: {e}")
-        
-    try:
-        geometry_cache.clear()
-    except Exception as e:
-        print(f"Error clearing geometry cache: {e}")
-        
-    try:
-        curve_cache.clear()
-    except Exception as e:
-        print(f"Error clearing curve cache: {e}")
-        
-    # Force garbage collection
+    for cache in list(_CACHES):
+        try:
+            cache.clear(collect=False)
+        except Exception as e:
+            print(f"Error clearing cache: {e}")
+
+    # Force garbage collection once for all caches
     try:
         gc.collect()
     except Exception as e:
         print(f"Error during garbage collection: {e}")
 
+
 def get_cache_stats() -> Dict[str, Dict[str, Any]]:
     """
     Get statistics for all caches.
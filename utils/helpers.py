@@ -34,8 +34,11 @@ def hex_from_rgba(rgba: Tuple[float, float, float, float]) -> str:
     Returns:
         Hexadecimal color string (e.g., "#FF0000" for red)
     """
-    r, g, b = [int(c * 255) for c in rgba[:3]]
-    return f"#{r:02x}{g:02x}{b:02x}"
+    # Imported here so the UI can import this module without loading NumPy
+    from ..geometry.utils import GeometryUtils
+
+    # Shares the memoized implementation (and its cache) with the exporter
+    return GeometryUtils.hex_from_rgba(rgba)
 
 
 def format_coordinate(value: float, precision: int, use_comma: bool) -> str:
@@ -50,8 +53,9 @@ def format_coordinate(value: float, precision: int, use_comma: bool) -> str:
     Returns:
         Formatted string representation
     """
-    formatted = f"{value:.{precision}f}"
-    return formatted.replace(".", ",") if use_comma else formatted
+    from ..geometry.utils import GeometryUtils
+
+    return GeometryUtils.format_coordinate(value, precision, use_comma)
 
 
 def apply_fill_preset(obj: bpy.types.Object, preset: str) -> None: